@@ -1,7 +1,7 @@
 """Visual representation of a connection between zones."""
 
 from PySide6.QtCore import QLineF, QPointF, QRectF, Qt
-from PySide6.QtGui import QBrush, QColor, QFont, QPainter, QPen
+from PySide6.QtGui import QFontMetrics, QPainter
 from PySide6.QtWidgets import (
     QGraphicsItem,
     QGraphicsPathItem,
@@ -9,6 +9,12 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
+from h3tc.editor.canvas.paint_cache import (
+    cached_brush,
+    cached_pen,
+    make_font,
+    theme_rgba,
+)
 from h3tc.editor.constants import (
     CONNECTION_COLOR,
     CONNECTION_SELECTED_COLOR,
@@ -112,20 +118,40 @@ class ConnectionItem(QGraphicsPathItem):
         p1 = _intersect_rect_line(r1, c1, c2)
         p2 = _intersect_rect_line(r2, c2, c1)
 
+        self._p1 = p1
+        self._p2 = p2
+        self._midpoint = QPointF((p1.x() + p2.x()) / 2, (p1.y() + p2.y()) / 2)
+        # Set before setPath, which queries boundingRect for the new geometry
+        self._label_rect = self._measure_label()
+
         path = QPainterPath()
         path.moveTo(p1)
         path.lineTo(p2)
         self.setPath(path)
 
-        self._p1 = p1
-        self._p2 = p2
-        self._midpoint = QPointF((p1.x() + p2.x()) / 2, (p1.y() + p2.y()) / 2)
+    def _measure_label(self) -> QRectF | None:
+        """Area of the pill label centered on the midpoint, or None."""
+        label = self._label
+        if not label:
+            return None
+        font = make_font(ThemeManager().theme.font_connection_label)
+        text_rect = QFontMetrics(font).boundingRect(label)
+        hw = text_rect.width() / 2 + 14
+        hh = text_rect.height() / 2 + 9
+        mid = self._midpoint
+        return QRectF(mid.x() - hw, mid.y() - hh, hw * 2, hh * 2)
 
     def refresh_path(self) -> None:
         """Refresh the path when connected zones move."""
         self._update_path()
         self.update()
 
+    def refresh_theme(self) -> None:
+        """Re-measure the label after the theme's label font changed."""
+        self.prepareGeometryChange()
+        self._label_rect = self._measure_label()
+        self.update()
+
     def paint(
         self,
         painter: QPainter,
@@ -136,15 +162,15 @@ class ConnectionItem(QGraphicsPathItem):
         t = ThemeManager().theme
 
         color = CONNECTION_SELECTED_COLOR if self.isSelected() else CONNECTION_COLOR
-        pen = QPen(color, self._line_width)
-        pen.setCapStyle(Qt.PenCapStyle.RoundCap)
+        color_rgba = color.rgba()
+        pen = cached_pen(
+            color_rgba, self._line_width, cap=Qt.PenCapStyle.RoundCap,
+        )
 
         label = self._label
         if label:
             # Measure label to create gap in line
-            font = QFont("Helvetica Neue", t.font_connection_label, QFont.Weight.Bold)
-            font.setStyleHint(QFont.StyleHint.SansSerif)
-            painter.setFont(font)
+            painter.setFont(make_font(t.font_connection_label))
             fm = painter.fontMetrics()
             text_rect = fm.boundingRect(label)
             label_w = text_rect.width() + 20
@@ -185,17 +211,17 @@ class ConnectionItem(QGraphicsPathItem):
                 label_h,
             )
             # Pill background
-            pill_bg = QColor(*t.connection_label_pill_bg)
             if t.connection_label_border:
-                border_color = QColor(*t.connection_label_border)
-                painter.setPen(QPen(border_color, t.connection_label_border_width))
+                painter.setPen(cached_pen(
+                    theme_rgba(tuple(t.connection_label_border)),
+                    t.connection_label_border_width,
+                ))
             else:
-                painter.setPen(QPen(color, 1))
-            painter.setBrush(QBrush(pill_bg))
+                painter.setPen(cached_pen(color_rgba))
+            painter.setBrush(cached_brush(theme_rgba(tuple(t.connection_label_pill_bg))))
             painter.drawRoundedRect(bg_rect, label_h / 2, label_h / 2)
             # Label text (charcoal, not red)
-            label_color = QColor(*t.connection_label_color)
-            painter.setPen(QPen(label_color))
+            painter.setPen(cached_pen(theme_rgba(tuple(t.connection_label_color))))
             painter.drawText(bg_rect, Qt.AlignmentFlag.AlignCenter, label)
         else:
             # No label, draw full line
@@ -204,8 +230,7 @@ class ConnectionItem(QGraphicsPathItem):
 
         # Wide indicator
         if self._is_wide:
-            pen = QPen(color, 1.5, Qt.PenStyle.DashLine)
-            painter.setPen(pen)
+            painter.setPen(cached_pen(color_rgba, 1.5, Qt.PenStyle.DashLine))
             line = QLineF(self._p1, self._p2)
             normal = line.normalVector()
             normal.setLength(5)
@@ -218,8 +243,13 @@ class ConnectionItem(QGraphicsPathItem):
             )
 
     def boundingRect(self) -> QRectF:
-        extra = max(self._line_width, 20)  # Extra for label
-        return self.path().boundingRect().adjusted(-extra, -extra, extra, extra)
+        extra = max(self._line_width, 20)
+        rect = self.path().boundingRect().adjusted(-extra, -extra, extra, extra)
+        if self._label_rect is not None:
+            # The pill must be fully covered so partial viewport updates
+            # repaint it cleanly
+            rect = rect.united(self._label_rect)
+        return rect
 
     def shape(self):
         """Make the clickable area wider than the visible line."""
@@ -8,25 +8,35 @@ from PySide6.QtCore import QPointF, QRectF, Qt
 from PySide6.QtGui import (
     QBrush,
     QColor,
-    QFont,
     QPainter,
     QPainterPath,
     QPen,
     QPolygonF,
 )
 
+from h3tc.editor.canvas.paint_cache import (
+    TEXT_DARK,
+    TEXT_LIGHT,
+    TEXT_SHADOW,
+    cached_pen,
+    make_font,
+    theme_color,
+    theme_rgba,
+)
 from h3tc.editor.constants import ThemeManager
 
 
 def _outline_color() -> QColor:
-    t = ThemeManager().theme
-    return QColor(*t.icon_outline_color)
+    return theme_color(tuple(ThemeManager().theme.icon_outline_color))
 
 
 def _pen(s: float) -> QPen:
     """Outline pen scaled to icon size."""
-    return QPen(_outline_color(), max(s * 0.08, 1.0), Qt.PenStyle.SolidLine,
-                Qt.PenCapStyle.RoundCap, Qt.PenJoinStyle.RoundJoin)
+    return cached_pen(
+        theme_rgba(tuple(ThemeManager().theme.icon_outline_color)),
+        max(s * 0.08, 1.0), cap=Qt.PenCapStyle.RoundCap,
+        join=Qt.PenJoinStyle.RoundJoin,
+    )
 
 
 # ── Treasure Chest ──────────────────────────────────────────────────
@@ -823,17 +833,15 @@ def draw_value_label(
 ) -> None:
     """Draw a plain value label. White on dark bg, black on light bg."""
     painter.save()
-    font = QFont("Helvetica Neue", font_size, QFont.Weight.Bold)
-    font.setStyleHint(QFont.StyleHint.SansSerif)
-    painter.setFont(font)
+    painter.setFont(make_font(font_size))
     r = QRectF(x, y, width, height)
     align = Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter
     if dark_bg:
         # 1px dark text shadow for readability on dark backgrounds
-        painter.setPen(QPen(QColor(0, 0, 0, 100)))
+        painter.setPen(cached_pen(TEXT_SHADOW))
         painter.drawText(r.adjusted(1, 1, 1, 1), align, text)
-        painter.setPen(QPen(QColor(255, 255, 255)))
+        painter.setPen(cached_pen(TEXT_LIGHT))
     else:
-        painter.setPen(QPen(QColor(30, 30, 30)))
+        painter.setPen(cached_pen(TEXT_DARK))
     painter.drawText(r, align, text)
     painter.restore()
@@ -5,7 +5,12 @@ import random
 from collections import defaultdict, deque
 
 from h3tc.editor.canvas.zone_item import zone_size
-from h3tc.models import TemplateMap
+from h3tc.models import TemplateMap, Zone
+
+# Force-directed convergence: minimum iterations before early exit, and the
+# relative change in displacement energy below which the layout is steady
+_FR_MIN_ITERATIONS = 20
+_FR_ENERGY_TOL = 1e-3
 
 
 def _build_adjacency(
@@ -24,7 +29,7 @@ def _build_adjacency(
 
 def _push_leaves_to_edges(
     positions: dict[str, tuple[float, float]],
-    zones: list,
+    zone_map: dict[str, Zone],
     adj: dict[str, set[str]],
     grid_size: float,
 ) -> dict[str, tuple[float, float]]:
@@ -34,12 +39,13 @@ def _push_leaves_to_edges(
     outward from their single neighbor, using the leaf's force-directed
     position to determine direction (not the layout center, which fails
     for star topologies where all leaves share one hub).
+
+    ``zone_map`` is keyed by already-stripped zone ID.
     """
     if not positions:
         return positions
 
     result = dict(positions)
-    zone_map = {z.id.strip(): z for z in zones}
 
     for zid, neighbors in adj.items():
         if len(neighbors) != 1:
@@ -48,7 +54,7 @@ def _push_leaves_to_edges(
         if not zone:
             continue
         # Only push player start zones
-        if not (hasattr(zone, "human_start") and zone.human_start.strip().lower() == "x"):
+        if zone.human_start.strip().lower() != "x":
             continue
 
         neighbor_id = next(iter(neighbors))
@@ -73,6 +79,36 @@ def _push_leaves_to_edges(
     return result
 
 
+def _align_axis(
+    result: dict[str, tuple[float, float]],
+    axis: int,
+    threshold: float,
+    grid_size: float,
+) -> None:
+    """Snap groups of near-equal coordinates on one axis, in place.
+
+    Coordinates are sorted once; a group grows while each value stays
+    within threshold of the group's first value.
+    """
+    ordered = sorted(result.items(), key=lambda item: item[1][axis])
+    coords = [pos[axis] for _, pos in ordered]
+    n = len(coords)
+    i = 0
+    while i < n:
+        first = coords[i]
+        j = i + 1
+        while j < n and coords[j] - first <= threshold:
+            j += 1
+        if j - i > 1:
+            avg = sum(coords[i:j]) / (j - i)
+            # Snap to nearest grid line
+            snapped = round(avg / grid_size) * grid_size
+            for zid, _ in ordered[i:j]:
+                x, y = result[zid]
+                result[zid] = (snapped, y) if axis == 0 else (x, snapped)
+        i = j
+
+
 def _align_rows_cols(
     positions: dict[str, tuple[float, float]],
     grid_size: float,
@@ -88,47 +124,8 @@ def _align_rows_cols(
 
     threshold = threshold_ratio * grid_size
     result = dict(positions)
-    zone_ids = list(result.keys())
-
-    # Align rows (y-coordinates)
-    sorted_by_y = sorted(zone_ids, key=lambda z: result[z][1])
-    i = 0
-    while i < len(sorted_by_y):
-        group = [sorted_by_y[i]]
-        j = i + 1
-        while j < len(sorted_by_y):
-            if abs(result[sorted_by_y[j]][1] - result[group[0]][1]) <= threshold:
-                group.append(sorted_by_y[j])
-                j += 1
-            else:
-                break
-        if len(group) > 1:
-            avg_y = sum(result[z][1] for z in group) / len(group)
-            # Snap to nearest grid line
-            snapped_y = round(avg_y / grid_size) * grid_size
-            for z in group:
-                result[z] = (result[z][0], snapped_y)
-        i = j
-
-    # Align columns (x-coordinates)
-    sorted_by_x = sorted(zone_ids, key=lambda z: result[z][0])
-    i = 0
-    while i < len(sorted_by_x):
-        group = [sorted_by_x[i]]
-        j = i + 1
-        while j < len(sorted_by_x):
-            if abs(result[sorted_by_x[j]][0] - result[group[0]][0]) <= threshold:
-                group.append(sorted_by_x[j])
-                j += 1
-            else:
-                break
-        if len(group) > 1:
-            avg_x = sum(result[z][0] for z in group) / len(group)
-            snapped_x = round(avg_x / grid_size) * grid_size
-            for z in group:
-                result[z] = (snapped_x, result[z][1])
-        i = j
-
+    _align_axis(result, 1, threshold, grid_size)  # rows
+    _align_axis(result, 0, threshold, grid_size)  # columns
     return result
 
 
@@ -333,6 +330,95 @@ def _resolve_collision(
                 break
 
 
+def _fruchterman_reingold(
+    xs: list[float],
+    ys: list[float],
+    repulsion_coef: list[list[float]],
+    edge_idx: list[tuple[int, int]],
+    k: float,
+    iterations: int,
+    width: float,
+    bounds: tuple[float, float, float, float],
+) -> None:
+    """Run Fruchterman-Reingold iterations on flat coordinate lists, in place.
+
+    ``repulsion_coef[i][j]`` is the precomputed k^2 * size factor for the
+    pair, ``edge_idx`` holds edges as index pairs and ``bounds`` is
+    (min_x, max_x, min_y, max_y).
+    """
+    min_x, max_x, min_y, max_y = bounds
+    n = len(xs)
+    sqrt = math.sqrt
+    hypot = math.hypot
+
+    # Displacement buffers are allocated once and zeroed each iteration
+    zeros = [0.0] * n
+    disp_x = zeros[:]
+    disp_y = zeros[:]
+
+    prev_energy = 0.0
+    for iteration in range(iterations):
+        temp = max(0.01, (1.0 - iteration / iterations) * width * 0.1)
+        disp_x[:] = zeros
+        disp_y[:] = zeros
+
+        # Repulsive forces between all pairs, scaled by zone sizes
+        for i in range(n):
+            xi = xs[i]
+            yi = ys[i]
+            coef = repulsion_coef[i]
+            for j in range(i + 1, n):
+                dx = xi - xs[j]
+                dy = yi - ys[j]
+                dist = max(sqrt(dx * dx + dy * dy), 0.01)
+                repulsion = coef[j] / dist
+
+                fx = (dx / dist) * repulsion
+                fy = (dy / dist) * repulsion
+                disp_x[i] += fx
+                disp_y[i] += fy
+                disp_x[j] -= fx
+                disp_y[j] -= fy
+
+        # Attractive forces along edges
+        for i, j in edge_idx:
+            dx = xs[i] - xs[j]
+            dy = ys[i] - ys[j]
+            dist = max(sqrt(dx * dx + dy * dy), 0.01)
+            attraction = (dist * dist) / k
+
+            fx = (dx / dist) * attraction
+            fy = (dy / dist) * attraction
+            disp_x[i] -= fx
+            disp_y[i] -= fy
+            disp_x[j] += fx
+            disp_y[j] += fy
+
+        # Apply displacements with temperature limiting
+        energy = 0.0
+        for i in range(n):
+            dx = disp_x[i]
+            dy = disp_y[i]
+            energy += dx * dx + dy * dy
+            dist = max(hypot(dx, dy), 0.01)
+            scale = min(dist, temp) / dist
+
+            # Keep within bounds
+            x = xs[i] + dx * scale
+            y = ys[i] + dy * scale
+            xs[i] = min_x if x < min_x else max_x if x > max_x else x
+            ys[i] = min_y if y < min_y else max_y if y > max_y else y
+
+        # Stop once the net force has settled; the floor keeps enough
+        # iterations for leaf-pushing and alignment to start from a sane spot
+        if (
+            iteration >= _FR_MIN_ITERATIONS
+            and abs(prev_energy - energy) / max(prev_energy, 1.0) < _FR_ENERGY_TOL
+        ):
+            break
+        prev_energy = energy
+
+
 def force_directed_layout(
     template_map: TemplateMap,
     width: float = 800.0,
@@ -352,7 +438,8 @@ def force_directed_layout(
         template_map: The template map containing zones and connections.
         width: Base canvas width for layout.
         height: Base canvas height for layout.
-        iterations: Number of iterations for convergence.
+        iterations: Maximum number of iterations; stops early once the
+            displacement energy stops changing.
         seed: Random seed for reproducible layout.
 
     Returns:
@@ -364,8 +451,9 @@ def force_directed_layout(
 
     rng = random.Random(seed)
 
-    # Build adjacency
+    # Build adjacency (zone IDs are stripped once and reused throughout)
     zone_ids = [z.id.strip() for z in zones]
+    zone_map = dict(zip(zone_ids, zones))
     id_set = set(zone_ids)
     edges: list[tuple[str, str]] = []
     for conn in template_map.connections:
@@ -386,9 +474,8 @@ def force_directed_layout(
     h = height * scale_factor
 
     # Zone sizes for repulsion scaling (use actual estimated side length)
-    zone_sizes: dict[str, float] = {}
-    for z in zones:
-        zone_sizes[z.id.strip()] = zone_size(z)[0]
+    sizes = [zone_size(z)[0] for z in zones]
+    zone_sizes = dict(zip(zone_ids, sizes))
 
     # Initial random positions
     positions: dict[str, list[float]] = {}
@@ -401,67 +488,34 @@ def force_directed_layout(
     area = w * h
     k = math.sqrt(area / n) * 1.7  # Optimal distance
 
-    for iteration in range(iterations):
-        temp = max(0.01, (1.0 - iteration / iterations) * w * 0.1)
-
-        # Repulsive forces between all pairs
-        disp: dict[str, list[float]] = {zid: [0.0, 0.0] for zid in zone_ids}
-
-        for i, z1 in enumerate(zone_ids):
-            for j in range(i + 1, n):
-                z2 = zone_ids[j]
-                dx = positions[z1][0] - positions[z2][0]
-                dy = positions[z1][1] - positions[z2][1]
-                dist = max(math.sqrt(dx * dx + dy * dy), 0.01)
-
-                # Scale repulsion by zone sizes
-                avg_size = (zone_sizes.get(z1, 200) + zone_sizes.get(z2, 200)) / 2
-                size_factor = avg_size / 150
-                repulsion = (k * k * size_factor) / dist
-
-                fx = (dx / dist) * repulsion
-                fy = (dy / dist) * repulsion
-                disp[z1][0] += fx
-                disp[z1][1] += fy
-                disp[z2][0] -= fx
-                disp[z2][1] -= fy
-
-        # Attractive forces along edges
-        for z1, z2 in edges:
-            dx = positions[z1][0] - positions[z2][0]
-            dy = positions[z1][1] - positions[z2][1]
-            dist = max(math.sqrt(dx * dx + dy * dy), 0.01)
-            attraction = (dist * dist) / k
-
-            fx = (dx / dist) * attraction
-            fy = (dy / dist) * attraction
-            disp[z1][0] -= fx
-            disp[z1][1] -= fy
-            disp[z2][0] += fx
-            disp[z2][1] += fy
-
-        # Apply displacements with temperature limiting
-        for zid in zone_ids:
-            dx, dy = disp[zid]
-            dist = max(math.sqrt(dx * dx + dy * dy), 0.01)
-            scale = min(dist, temp) / dist
-            positions[zid][0] += dx * scale
-            positions[zid][1] += dy * scale
-
-            # Keep within bounds
-            margin = 80
-            positions[zid][0] = max(margin, min(w - margin, positions[zid][0]))
-            positions[zid][1] = max(margin, min(h - margin, positions[zid][1]))
-
-    result = {zid: (pos[0], pos[1]) for zid, pos in positions.items()}
+    # Flatten to index-addressed arrays for the O(n^2) loop: no dict lookups
+    # or per-pair size math inside the iterations
+    ids = list(positions)
+    index = {zid: i for i, zid in enumerate(ids)}
+    xs = [positions[zid][0] for zid in ids]
+    ys = [positions[zid][1] for zid in ids]
+    id_sizes = [zone_sizes.get(zid, 200) for zid in ids]
+    kk = k * k
+    repulsion_coef = [
+        [kk * (((s1 + s2) / 2) / 150) for s2 in id_sizes] for s1 in id_sizes
+    ]
+    edge_idx = [(index[z1], index[z2]) for z1, z2 in edges]
+
+    margin = 80
+    _fruchterman_reingold(
+        xs, ys, repulsion_coef, edge_idx, k, iterations, w,
+        (margin, w - margin, margin, h - margin),
+    )
+
+    result = {zid: (xs[i], ys[i]) for i, zid in enumerate(ids)}
 
     # Dynamic grid size based on largest zone width
-    max_width = max((zone_size(z)[0] for z in zones), default=150)
+    max_width = max(sizes, default=150)
     gap = 80.0
     grid_size = max_width + gap
 
     # Post-processing pipeline
-    result = _push_leaves_to_edges(result, zones, adj, grid_size)
+    result = _push_leaves_to_edges(result, zone_map, adj, grid_size)
     result = snap_to_grid(result, grid_size=grid_size, adj=adj)
     result = _align_rows_cols(result, grid_size)
 
@@ -0,0 +1,60 @@
+"""Memoized colors, pens, brushes and fonts shared by the canvas items.
+
+Every object returned here is shared between callers and must not be
+mutated; copy it first if a tweaked variant is needed.
+"""
+
+from functools import lru_cache
+
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QBrush, QColor, QFont, QPen
+
+
+# Label text: light on dark fills (with a 1px shadow), dark on light fills
+TEXT_LIGHT = QColor(255, 255, 255).rgba()
+TEXT_DARK = QColor(30, 30, 30).rgba()
+TEXT_SHADOW = QColor(0, 0, 0, 120).rgba()
+
+
+@lru_cache(maxsize=64)
+def theme_color(rgb: tuple[int, ...]) -> QColor:
+    """QColor for a theme RGB(A) tuple."""
+    return QColor(*rgb)
+
+
+@lru_cache(maxsize=64)
+def theme_rgba(rgb: tuple[int, ...]) -> int:
+    """ARGB value for a theme RGB(A) tuple."""
+    return QColor(*rgb).rgba()
+
+
+@lru_cache(maxsize=64)
+def make_font(size: int, bold: bool = True, extra_bold: bool = False) -> QFont:
+    """Canvas label font for (size, weight)."""
+    if extra_bold:
+        weight = QFont.Weight.ExtraBold
+    elif bold:
+        weight = QFont.Weight.Bold
+    else:
+        weight = QFont.Weight.Normal
+    f = QFont("Helvetica Neue", size, weight)
+    f.setStyleHint(QFont.StyleHint.SansSerif)
+    return f
+
+
+@lru_cache(maxsize=128)
+def cached_pen(
+    rgba: int,
+    width: float = 1,
+    style: Qt.PenStyle = Qt.PenStyle.SolidLine,
+    cap: Qt.PenCapStyle = Qt.PenCapStyle.SquareCap,
+    join: Qt.PenJoinStyle = Qt.PenJoinStyle.BevelJoin,
+) -> QPen:
+    """Pen for an ARGB value; the defaults match a plain ``QPen(color, width)``."""
+    return QPen(QColor.fromRgba(rgba), width, style, cap, join)
+
+
+@lru_cache(maxsize=128)
+def cached_brush(rgba: int) -> QBrush:
+    """Solid brush for an ARGB value."""
+    return QBrush(QColor.fromRgba(rgba))
@@ -1,6 +1,8 @@
 """Graphics scene managing zone and connection items."""
 
-from PySide6.QtCore import Signal
+import math
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, QTimer, Signal
 from PySide6.QtWidgets import QGraphicsScene
 
 from h3tc.editor.canvas.connection_item import ConnectionItem
@@ -9,10 +11,53 @@ from h3tc.editor.canvas.layout import (
     force_directed_layout,
     image_settings_layout,
 )
-from h3tc.editor.canvas.zone_item import ZoneItem
+from h3tc.editor.canvas.zone_item import ZoneItem, zone_size
 from h3tc.editor.constants import DisplayMode, ThemeManager
 from h3tc.models import Connection, TemplateMap, Zone
 
+# Below this many items a linear scan beats keeping a BSP tree up to date
+# while zones and their connection paths are dragged around
+_BSP_MIN_ITEMS = 60
+
+# Maps with at least this many zones run the force-directed fallback layout
+# on a worker thread; smaller ones finish faster than a visible placeholder
+_ASYNC_LAYOUT_MIN_ZONES = 32
+
+
+def _pair_key(a: str, b: str) -> tuple[str, str]:
+    """Order-independent key for a connection between two zone IDs."""
+    return (a, b) if a < b else (b, a)
+
+
+def _placeholder_grid(zones: list[Zone]) -> dict[str, tuple[float, float]]:
+    """Square grid shown while the real layout is computed in the background."""
+    cols = math.ceil(math.sqrt(len(zones)))
+    step = max((zone_size(z)[0] for z in zones), default=150) + 80
+    return {
+        z.id.strip(): ((i % cols) * step, (i // cols) * step)
+        for i, z in enumerate(zones)
+    }
+
+
+class _LayoutSignals(QObject):
+    finished = Signal(int, object)  # load generation, positions dict
+
+
+class _LayoutWorker(QRunnable):
+    """Runs force_directed_layout on a copy of the map off the UI thread."""
+
+    def __init__(
+        self, template_map: TemplateMap, generation: int, signals: _LayoutSignals
+    ) -> None:
+        super().__init__()
+        self._template_map = template_map
+        self._generation = generation
+        self._signals = signals
+
+    def run(self) -> None:
+        positions = force_directed_layout(self._template_map)
+        self._signals.finished.emit(self._generation, positions)
+
 
 class TemplateScene(QGraphicsScene):
     """Scene that manages zone items and connection items for a template map."""
@@ -21,12 +66,35 @@ class TemplateScene(QGraphicsScene):
     connection_selected = Signal(object)  # Connection or None
     selection_cleared = Signal()
     scene_modified = Signal()
+    layout_applied = Signal()  # Background auto-layout moved the zones
 
     def __init__(self, parent=None) -> None:
         super().__init__(parent)
         self._zone_items: dict[str, ZoneItem] = {}  # zone_id -> ZoneItem
         self._connection_items: list[ConnectionItem] = []
+        # zone item -> connection items touching it, for O(degree) updates
+        self._conn_by_zone_item: dict[ZoneItem, list[ConnectionItem]] = {}
+        # Stripped (zone1, zone2) pairs for re-ID; None = rebuild on demand
+        self._adj_stripped: list[tuple[str, str]] | None = None
+        # (pairs list it was built from, unordered pair set) for has_connection
+        self._pair_set: tuple[list, frozenset] | None = None
         self._template_map: TemplateMap | None = None
+        self._batch_moving = False  # Suppresses per-item zone_moved work
+        # Zones moved since the last flush; drained once per event-loop pass
+        self._dirty_zones: set[ZoneItem] = set()
+        self._flush_scheduled = False
+        # Last item reported by _on_selection_changed; () = cleared, None = unknown
+        self._last_selection_key: tuple | None = None
+        # Bumped per load_map so stale background layouts are ignored
+        self._layout_generation = 0
+        self._pending_layout: dict[str, ZoneItem] = {}
+        # Set by the first edit after load_map; late positions then leave
+        # the zones alone
+        self._modified_since_load = False
+        # Unparented: each worker holds a reference, so the emitter outlives
+        # a scene that is dropped while its layout is still running
+        self._layout_signals = _LayoutSignals()
+        self._layout_signals.finished.connect(self._apply_layout)
         self._snap_to_grid = False
         self._display_mode = DisplayMode.DETAILS
         self.selectionChanged.connect(self._on_selection_changed)
@@ -50,6 +118,14 @@ class TemplateScene(QGraphicsScene):
         for item in self._zone_items.values():
             item.update()
 
+    @property
+    def modified_since_load(self) -> bool:
+        return self._modified_since_load
+
+    def mark_modified(self) -> None:
+        """Record that the user has edited this scene's map since loading."""
+        self._modified_since_load = True
+
     @property
     def template_map(self) -> TemplateMap | None:
         return self._template_map
@@ -63,17 +139,32 @@ class TemplateScene(QGraphicsScene):
         self.clear()
         self._zone_items.clear()
         self._connection_items.clear()
+        self._conn_by_zone_item.clear()
+        self._dirty_zones.clear()
+        self._pending_layout.clear()
+        self._adj_stripped = None
+        self._last_selection_key = None
+        self._layout_generation += 1
+        self._modified_since_load = False
         self._template_map = template_map
 
         if not template_map.zones:
             return
 
+        positions = saved_positions or {}
+        run_async = False
         # Try image_settings positions first (HOTA editor coordinates)
         auto_positions = image_settings_layout(template_map)
         if auto_positions is None:
-            # Fall back to grid-snapped force-directed layout
-            auto_positions = force_directed_layout(template_map)
-        positions = saved_positions or {}
+            # Fall back to grid-snapped force-directed layout, computed in
+            # the background for large maps the saved positions don't cover
+            run_async = len(template_map.zones) >= _ASYNC_LAYOUT_MIN_ZONES and any(
+                z.id.strip() not in positions for z in template_map.zones
+            )
+            if run_async:
+                auto_positions = _placeholder_grid(template_map.zones)
+            else:
+                auto_positions = force_directed_layout(template_map)
 
         # Create zone items
         for zone in template_map.zones:
@@ -83,6 +174,8 @@ class TemplateScene(QGraphicsScene):
             item.setPos(x, y)
             self.addItem(item)
             self._zone_items[zid] = item
+            if run_async and zid not in positions:
+                self._pending_layout[zid] = item
 
         # Create connection items
         for conn in template_map.connections:
@@ -93,19 +186,149 @@ class TemplateScene(QGraphicsScene):
                     conn, self._zone_items[z1], self._zone_items[z2]
                 )
                 self.addItem(item)
-                self._connection_items.append(item)
+                self._track_connection_item(item)
+
+        self._update_index_method()
+
+        if run_async:
+            QThreadPool.globalInstance().start(_LayoutWorker(
+                template_map.model_copy(deep=True),
+                self._layout_generation,
+                self._layout_signals,
+            ))
+
+    def invalidate(self) -> None:
+        """Cancel deferred work before the scene is dropped.
+
+        A background layout still running for this scene is ignored when
+        it finishes, and a queued move flush finds nothing to do.
+        """
+        self._layout_generation += 1
+        self._pending_layout.clear()
+        self._dirty_zones.clear()
+
+    def _apply_layout(
+        self, generation: int, positions: dict[str, tuple[float, float]]
+    ) -> None:
+        """Move placeholder-placed zones to the background layout result."""
+        if generation != self._layout_generation:
+            return  # A different map has been loaded since
+        self._batch_moving = True
+        try:
+            for zid, item in self._pending_layout.items():
+                if zid in positions and item.scene() is self:
+                    item.setPos(*positions[zid])
+        finally:
+            self._batch_moving = False
+        self._pending_layout.clear()
+        for ci in self._connection_items:
+            ci.refresh_path()
+        self.layout_applied.emit()
+
+    def _update_index_method(self) -> None:
+        """Pick the item index strategy for the current scene size."""
+        n = len(self._zone_items) + len(self._connection_items)
+        if n >= _BSP_MIN_ITEMS:
+            method = QGraphicsScene.ItemIndexMethod.BspTreeIndex
+        else:
+            method = QGraphicsScene.ItemIndexMethod.NoIndex
+        if self.itemIndexMethod() != method:
+            self.setItemIndexMethod(method)
+            if method == QGraphicsScene.ItemIndexMethod.BspTreeIndex:
+                self.setBspTreeDepth(0)  # Let Qt size the tree from item count
+
+    def _connection_pairs(self) -> list[tuple[str, str]]:
+        """Stripped (zone1, zone2) pairs for the current map, cached."""
+        if self._adj_stripped is None:
+            self._adj_stripped = [
+                (c.zone1.strip(), c.zone2.strip())
+                for c in self._template_map.connections
+            ]
+        return self._adj_stripped
+
+    def has_connection(self, zone1_id: str, zone2_id: str) -> bool:
+        """Whether the map connects the two (stripped) zone IDs either way."""
+        if self._template_map is None:
+            return False
+        pairs = self._connection_pairs()
+        cached = self._pair_set
+        if cached is None or cached[0] is not pairs:
+            # Rebuilt only when _connection_pairs() was invalidated
+            cached = self._pair_set = (
+                pairs, frozenset(_pair_key(a, b) for a, b in pairs),
+            )
+        return _pair_key(zone1_id, zone2_id) in cached[1]
+
+    def _track_connection_item(self, item: ConnectionItem) -> None:
+        self._adj_stripped = None
+        self._connection_items.append(item)
+        self._conn_by_zone_item.setdefault(item.zone1_item, []).append(item)
+        self._conn_by_zone_item.setdefault(item.zone2_item, []).append(item)
+
+    def _remove_connection_item(self, item: ConnectionItem) -> None:
+        """Remove a connection item from the scene, map and incidence index."""
+        if item not in self._connection_items:
+            return  # Already removed along with one of its zones
+        self._adj_stripped = None
+        self._template_map.connections.remove(item.connection)
+        self._connection_items.remove(item)
+        for zone_item in (item.zone1_item, item.zone2_item):
+            incident = self._conn_by_zone_item.get(zone_item)
+            if incident and item in incident:
+                incident.remove(item)
+        self.removeItem(item)
 
     def zone_moved(self, zone_item: ZoneItem) -> None:
-        """Called when a zone item is dragged. Updates connected lines."""
-        zid = zone_item.zone.id.strip()
-        for conn_item in self._connection_items:
-            if (
-                conn_item.zone1_item is zone_item
-                or conn_item.zone2_item is zone_item
-            ):
-                conn_item.refresh_path()
+        """Called when a zone item is dragged. Schedules a line update.
+
+        Moves are coalesced: dragging several selected zones marks each
+        one dirty, and a single deferred flush refreshes the affected
+        connections and emits scene_modified once.
+        """
+        if self._batch_moving:
+            return
+        if self._pending_layout:
+            # A zone placed by hand keeps its spot when the layout lands
+            self._pending_layout.pop(zone_item.zone_key, None)
+        self._dirty_zones.add(zone_item)
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            QTimer.singleShot(0, self._flush_moves)
+
+    def _flush_moves(self) -> None:
+        self._flush_scheduled = False
+        if not self._dirty_zones:
+            return
+        refreshed: set[ConnectionItem] = set()
+        for zone_item in self._dirty_zones:
+            for conn_item in self._conn_by_zone_item.get(zone_item, ()):
+                if conn_item not in refreshed:
+                    refreshed.add(conn_item)
+                    conn_item.refresh_path()
+        self._dirty_zones.clear()
         self.scene_modified.emit()
 
+    def apply_positions(self, positions: dict[str, tuple[float, float]]) -> None:
+        """Move zones to positions that arrived after the map was loaded.
+
+        Zones placed this way are dropped from any pending background
+        layout, so a later auto-layout result can't override them.
+        """
+        moved = set()
+        self._batch_moving = True
+        try:
+            for zid, pos in positions.items():
+                item = self._zone_items.get(zid)
+                if item is not None:
+                    item.setPos(*pos)
+                    moved.add(item)
+                    self._pending_layout.pop(zid, None)
+        finally:
+            self._batch_moving = False
+        for item in moved:
+            for ci in self._conn_by_zone_item.get(item, ()):
+                ci.refresh_path()
+
     def get_zone_positions(self) -> dict[str, tuple[float, float]]:
         """Get current zone positions for saving to sidecar."""
         positions = {}
@@ -143,7 +366,7 @@ class TemplateScene(QGraphicsScene):
             connection, self._zone_items[z1], self._zone_items[z2]
         )
         self.addItem(item)
-        self._connection_items.append(item)
+        self._track_connection_item(item)
         self.scene_modified.emit()
         return item
 
@@ -154,26 +377,18 @@ class TemplateScene(QGraphicsScene):
 
         for item in self.selectedItems():
             if isinstance(item, ZoneItem):
-                zid = item.zone.id.strip()
+                zid = item.zone_key
+                self._dirty_zones.discard(item)
                 # Remove connections to this zone
-                to_remove = [
-                    ci
-                    for ci in self._connection_items
-                    if ci.zone1_item is item or ci.zone2_item is item
-                ]
-                for ci in to_remove:
-                    self._template_map.connections.remove(ci.connection)
-                    self._connection_items.remove(ci)
-                    self.removeItem(ci)
+                for ci in list(self._conn_by_zone_item.pop(item, ())):
+                    self._remove_connection_item(ci)
                 # Remove zone
                 self._template_map.zones.remove(item.zone)
                 del self._zone_items[zid]
                 self.removeItem(item)
 
             elif isinstance(item, ConnectionItem):
-                self._template_map.connections.remove(item.connection)
-                self._connection_items.remove(item)
-                self.removeItem(item)
+                self._remove_connection_item(item)
 
         self.scene_modified.emit()
 
@@ -193,38 +408,55 @@ class TemplateScene(QGraphicsScene):
         if item is None:
             return
 
+        self._adj_stripped = None  # Callers may have renumbered connections
         new_key = zone.id.strip()
         if old_key != new_key:
             del self._zone_items[old_key]
             self._zone_items[new_key] = item
         item.refresh()
 
+    def refresh_zones(self, zones: list[Zone]) -> None:
+        """Refresh several zone items in one pass after bulk model changes.
+
+        Keys are rebuilt once at the end, so renumbering that swaps two IDs
+        can't overwrite one item's entry with another's.
+        """
+        wanted = {id(z) for z in zones}
+        items = [zi for zi in self._zone_items.values() if id(zi.zone) in wanted]
+        if not items:
+            return
+        self._adj_stripped = None  # Callers may have renumbered connections
+        for item in items:
+            item.refresh()
+        self._zone_items = {zi.zone_key: zi for zi in self._zone_items.values()}
+
     def scale_zone_distances(self, factor: float) -> None:
         """Scale distances between all zones by factor (>1 = spread, <1 = compact)."""
         if not self._zone_items:
             return
-        # Compute centroid
-        cx, cy = 0.0, 0.0
-        for item in self._zone_items.values():
-            pos = item.pos()
-            cx += pos.x()
-            cy += pos.y()
-        n = len(self._zone_items)
-        cx /= n
-        cy /= n
-        # Scale positions relative to centroid
-        for item in self._zone_items.values():
-            pos = item.pos()
-            nx = cx + (pos.x() - cx) * factor
-            ny = cy + (pos.y() - cy) * factor
-            item.setPos(nx, ny)
-        # Refresh all connections
+        # Read every position once, then compute centroid
+        items = list(self._zone_items.values())
+        points = [item.pos() for item in items]
+        xs = [p.x() for p in points]
+        ys = [p.y() for p in points]
+        n = len(items)
+        cx = sum(xs) / n
+        cy = sum(ys) / n
+        # Scale positions relative to centroid; connections are refreshed
+        # once below rather than per moved zone
+        self._batch_moving = True
+        try:
+            for item, x, y in zip(items, xs, ys):
+                item.setPos(cx + (x - cx) * factor, cy + (y - cy) * factor)
+        finally:
+            self._batch_moving = False
         for ci in self._connection_items:
             ci.refresh_path()
         self.scene_modified.emit()
 
     def refresh_connection(self, connection: Connection) -> None:
         """Refresh a connection item's appearance after model changes."""
+        self._adj_stripped = None  # Endpoints may have been edited
         for ci in self._connection_items:
             if ci.connection is connection:
                 ci.refresh_path()
@@ -299,6 +531,7 @@ class TemplateScene(QGraphicsScene):
                     conn.zone1 = conn_id_map[z1]
                 if z2 in conn_id_map:
                     conn.zone2 = conn_id_map[z2]
+            self._adj_stripped = None
 
             # Rebuild _zone_items with temp IDs
             self._zone_items.clear()
@@ -308,11 +541,9 @@ class TemplateScene(QGraphicsScene):
 
         # --- Now run the normal Re-ID with unique IDs ---
         positions = self.get_zone_positions()
-        connections = [
-            (c.zone1.strip(), c.zone2.strip())
-            for c in self._template_map.connections
-        ]
-        mapping = compute_zone_reids(positions, connections, method=method)
+        mapping = compute_zone_reids(
+            positions, self._connection_pairs(), method=method
+        )
 
         if not mapping:
             return None
@@ -340,6 +571,7 @@ class TemplateScene(QGraphicsScene):
                 conn.zone1 = mapping[old1]
             if old2 in mapping:
                 conn.zone2 = mapping[old2]
+        self._adj_stripped = None
 
         # Rebuild _zone_items dict with new keys (same ZoneItem objects)
         new_zone_items: dict[str, ZoneItem] = {}
@@ -360,10 +592,17 @@ class TemplateScene(QGraphicsScene):
         for item in self._zone_items.values():
             item.refresh()
         for ci in self._connection_items:
-            ci.update()
+            # Label size follows the theme font, so geometry may change
+            ci.refresh_theme()
 
     def _on_selection_changed(self) -> None:
         selected = self.selectedItems()
+        # Rubber-band drags fire this on every tick; only notify the panels
+        # when the primary selected item actually changes.
+        key = (selected[0],) if selected else ()
+        if key == self._last_selection_key:
+            return
+        self._last_selection_key = key
         if not selected:
             self.selection_cleared.emit()
             return
@@ -1,6 +1,8 @@
 """Zoomable, pannable graphics view with grid background."""
 
-from PySide6.QtCore import Qt, QRectF, QEvent
+import math
+
+from PySide6.QtCore import Qt, QLineF, QRectF, QEvent
 from PySide6.QtGui import QColor, QPainter, QPen, QWheelEvent, QMouseEvent
 from PySide6.QtWidgets import QGestureEvent, QGraphicsView, QPinchGesture
 
@@ -22,6 +24,8 @@ class TemplateView(QGraphicsView):
         self._zoom = 1.0
         self._panning = False
         self._pan_start = None
+        # Zoomed or panned by the user since the last zoom_to_fit
+        self._navigated = False
 
         self.setRenderHints(
             QPainter.RenderHint.Antialiasing
@@ -30,7 +34,7 @@ class TemplateView(QGraphicsView):
         self.setDragMode(QGraphicsView.DragMode.RubberBandDrag)
         self.setTransformationAnchor(QGraphicsView.ViewportAnchor.AnchorUnderMouse)
         self.setResizeAnchor(QGraphicsView.ViewportAnchor.AnchorViewCenter)
-        self.setViewportUpdateMode(QGraphicsView.ViewportUpdateMode.FullViewportUpdate)
+        self.setViewportUpdateMode(QGraphicsView.ViewportUpdateMode.SmartViewportUpdate)
         self._apply_theme_bg()
         self.setMinimumSize(400, 300)
 
@@ -54,34 +58,28 @@ class TemplateView(QGraphicsView):
 
         left = int(rect.left()) - (int(rect.left()) % GRID_SIZE)
         top = int(rect.top()) - (int(rect.top()) % GRID_SIZE)
-
-        # Minor grid lines
+        r_left, r_top = int(rect.left()), int(rect.top())
+        r_right, r_bottom = int(rect.right()), int(rect.bottom())
+        major_step = GRID_SIZE * GRID_MAJOR_EVERY
+
+        # Collect lines per pen so each set is a single drawLines call
+        minor: list[QLineF] = []
+        major: list[QLineF] = []
+        for x in range(left, math.floor(rect.right()) + 1, GRID_SIZE):
+            lines = major if x % major_step == 0 else minor
+            lines.append(QLineF(x, r_top, x, r_bottom))
+        for y in range(top, math.floor(rect.bottom()) + 1, GRID_SIZE):
+            lines = major if y % major_step == 0 else minor
+            lines.append(QLineF(r_left, y, r_right, y))
+
+        # Grid lines are axis-aligned, so antialiasing only costs fill rate
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, False)
         painter.setPen(QPen(QColor(*t.grid_color), t.grid_minor_width))
-        x = left
-        while x <= rect.right():
-            if (x // GRID_SIZE) % GRID_MAJOR_EVERY != 0:
-                painter.drawLine(x, int(rect.top()), x, int(rect.bottom()))
-            x += GRID_SIZE
-
-        y = top
-        while y <= rect.bottom():
-            if (y // GRID_SIZE) % GRID_MAJOR_EVERY != 0:
-                painter.drawLine(int(rect.left()), y, int(rect.right()), y)
-            y += GRID_SIZE
-
-        # Major grid lines
+        painter.drawLines(minor)
         painter.setPen(QPen(QColor(*t.grid_major_color), t.grid_major_width))
-        x = left
-        while x <= rect.right():
-            if (x // GRID_SIZE) % GRID_MAJOR_EVERY == 0:
-                painter.drawLine(x, int(rect.top()), x, int(rect.bottom()))
-            x += GRID_SIZE
-
-        y = top
-        while y <= rect.bottom():
-            if (y // GRID_SIZE) % GRID_MAJOR_EVERY == 0:
-                painter.drawLine(int(rect.left()), y, int(rect.right()), y)
-            y += GRID_SIZE
+        painter.drawLines(major)
+        painter.restore()
 
     def event(self, event: QEvent) -> bool:
         if event.type() == QEvent.Type.Gesture:
@@ -91,6 +89,7 @@ class TemplateView(QGraphicsView):
     def _gesture_event(self, event: QGestureEvent) -> bool:
         pinch = event.gesture(Qt.GestureType.PinchGesture)
         if pinch and isinstance(pinch, QPinchGesture):
+            self._navigated = True
             factor = pinch.scaleFactor()
             new_zoom = self._zoom * factor
             if MIN_ZOOM <= new_zoom <= MAX_ZOOM:
@@ -102,6 +101,7 @@ class TemplateView(QGraphicsView):
 
     def wheelEvent(self, event: QWheelEvent) -> None:
         # Ctrl+scroll = zoom; plain scroll = pan (default)
+        self._navigated = True
         if event.modifiers() & Qt.KeyboardModifier.ControlModifier:
             delta = event.angleDelta().y()
             if delta == 0:
@@ -122,6 +122,7 @@ class TemplateView(QGraphicsView):
     def mousePressEvent(self, event: QMouseEvent) -> None:
         if event.button() == Qt.MouseButton.MiddleButton:
             self._panning = True
+            self._navigated = True
             self._pan_start = event.position()
             self.setCursor(Qt.CursorShape.ClosedHandCursor)
             event.accept()
@@ -157,6 +158,12 @@ class TemplateView(QGraphicsView):
             self.fitInView(scene.itemsBoundingRect().adjusted(-50, -50, 50, 50),
                            Qt.AspectRatioMode.KeepAspectRatio)
             self._zoom = self.transform().m11()
+        self._navigated = False
+
+    @property
+    def user_navigated(self) -> bool:
+        """Whether the user zoomed or panned since the last zoom_to_fit."""
+        return self._navigated
 
     @property
     def zoom_level(self) -> float:
@@ -6,11 +6,12 @@ Zone colors: player start = player color, treasure = gray/gold, junction = gold.
 """
 
 import math
+from dataclasses import dataclass
+from functools import lru_cache
 
 from PySide6.QtCore import QPointF, QRectF, Qt
-from PySide6.QtGui import QBrush, QColor, QFont, QPainter, QPen
+from PySide6.QtGui import QBrush, QColor, QFont, QPainter, QStaticText
 from PySide6.QtWidgets import (
-    QGraphicsDropShadowEffect,
     QGraphicsItem,
     QGraphicsRectItem,
     QStyleOptionGraphicsItem,
@@ -26,7 +27,17 @@ from h3tc.editor.canvas.icons import (
     draw_treasure_chest,
     draw_value_label,
 )
+from h3tc.editor.canvas.paint_cache import (
+    TEXT_DARK,
+    TEXT_LIGHT,
+    TEXT_SHADOW,
+    cached_brush,
+    cached_pen,
+    make_font,
+    theme_color,
+)
 from h3tc.editor.constants import (
+    GRID_SIZE,
     SELECTION_COLOR,
     DisplayMode,
     ZONE_SIZE_SCALE,
@@ -41,6 +52,25 @@ _CELL_W = _ICO + 14 # Cell width: icon + padding (count goes below, not beside)
 _MARGIN = 16        # Margin inside zone rect
 _COLS = 5           # Icons per row
 
+# Drop shadow painted under the zone: offset, then (spread, alpha) layers
+# drawn outermost first to approximate a soft blur without an effect pass
+_SHADOW_DX = 3
+_SHADOW_DY = 4
+_SHADOW_LAYERS = ((5, 12), (3, 16), (1, 22))
+_SHADOW_EXTENT = max(spread for spread, _ in _SHADOW_LAYERS)
+
+_ITEM_POSITION_CHANGE = QGraphicsItem.GraphicsItemChange.ItemPositionChange
+_ITEM_POSITION_HAS_CHANGED = QGraphicsItem.GraphicsItemChange.ItemPositionHasChanged
+_ITEM_SCENE_HAS_CHANGED = QGraphicsItem.GraphicsItemChange.ItemSceneHasChanged
+
+# Level-of-detail thresholds (device pixels per scene unit): below
+# _LOD_OUTLINE only the zone body is painted, below _LOD_FULL the
+# content rows are dropped and only the header and ID remain
+_LOD_OUTLINE = 0.3
+_LOD_FULL = 0.7
+# Zones narrower than this on screen are drawn as a plain square
+_TINY_ZONE_PX = 30
+
 
 def _header_h() -> int:
     """Header row height: adapts to treasure font size."""
@@ -59,8 +89,19 @@ def _theme():
     return ThemeManager().theme
 
 
-def _zone_color(zone: Zone) -> QColor:
-    """Zone color based on type and treasure value.
+@lru_cache(maxsize=64)
+def _zone_swatch(rgb: tuple[int, ...]) -> tuple[QColor, bool]:
+    """Theme zone color paired with whether text on it needs the light style.
+
+    The palette is a handful of player/treasure colors, so the brightness
+    test runs once per palette entry rather than once per zone refresh.
+    """
+    brightness = rgb[0] * 0.299 + rgb[1] * 0.587 + rgb[2] * 0.114
+    return theme_color(rgb), brightness < 150
+
+
+def _zone_color(zone: Zone, tval: int) -> tuple[QColor, bool]:
+    """Zone color and its dark-background flag, by type and treasure ``tval``.
 
     Player start = player color from theme.
     Non-player zones colored by treasure value.
@@ -70,18 +111,22 @@ def _zone_color(zone: Zone) -> QColor:
         owner = zone.ownership.strip()
         colors = t.zone_player_colors
         rgb = colors.get(owner, colors["0"])
-        return QColor(*rgb)
+        return _zone_swatch(tuple(rgb))
 
-    tval = _treasure_value(zone)
     if tval >= 200:
-        return QColor(*t.zone_treasure_high)
+        return _zone_swatch(tuple(t.zone_treasure_high))
     if tval >= 100:
-        return QColor(*t.zone_treasure_mid)
-    return QColor(*t.zone_treasure_low)
+        return _zone_swatch(tuple(t.zone_treasure_mid))
+    return _zone_swatch(tuple(t.zone_treasure_low))
 
 
+@lru_cache(maxsize=256)
 def _int_val(s: str) -> int:
+    # Templates reuse a small set of cell strings ("", "0", "1", "2500", ...)
     s = s.strip()
+    # Plain digits are the common case; avoid exception setup for them
+    if s.isdecimal():
+        return int(s)
     if not s:
         return 0
     try:
@@ -90,22 +135,14 @@ def _int_val(s: str) -> int:
         return 0
 
 
-def _has_towns(zone: Zone) -> bool:
-    pt = zone.player_towns
-    nt = zone.neutral_towns
-    return any(
-        _int_val(v) > 0
-        for v in [pt.min_towns, pt.min_castles, nt.min_towns, nt.min_castles]
-    )
-
-
 def _active_mines(zone: Zone) -> list[tuple[str, int, int]]:
     result = []
+    min_mines = zone.min_mines
+    density = zone.mine_density
     for res in RESOURCES:
-        mc = _int_val(zone.min_mines.get(res, ""))
-        md = _int_val(zone.mine_density.get(res, ""))
+        mc = _int_val(min_mines.get(res, ""))
         if mc > 0:
-            result.append((res, mc, md))
+            result.append((res, mc, _int_val(density.get(res, ""))))
     return result
 
 
@@ -126,50 +163,78 @@ def _monster_strength(zone: Zone) -> int:
 
 def _treasure_value(zone: Zone) -> int:
     """Calculate treasure value: sum of (low+high)/2 * density / 1000."""
+    # Integer sum of (low+high)*density, halved and scaled once at the end
     total = 0
     for tier in zone.treasure_tiers:
+        density = _int_val(tier.density)
+        if density <= 0:
+            continue
         low = _int_val(tier.low)
         high = _int_val(tier.high)
-        density = _int_val(tier.density)
-        if (low > 0 or high > 0) and density > 0:
-            total += (low + high) / 2 * density
-    return int(total / 1000) if total > 0 else 0
+        if low > 0 or high > 0:
+            total += (low + high) * density
+    return total // 2000 if total > 0 else 0
+
+
+def _town_counts(zone: Zone) -> tuple[int, int, int, int]:
+    """(player castles, player towns, neutral castles, neutral towns), >= 0."""
+    pt = zone.player_towns
+    nt = zone.neutral_towns
+    return (
+        max(_int_val(pt.min_castles), 0),
+        max(_int_val(pt.min_towns), 0),
+        max(_int_val(nt.min_castles), 0),
+        max(_int_val(nt.min_towns), 0),
+    )
 
 
 def _content_metrics(zone: Zone) -> tuple[int, int]:
     """Return (rows, max_icons_in_any_row) for zone content."""
+    p_c, p_t, n_c, n_t = _town_counts(zone)
+    return _shape(
+        (p_c > 0) + (p_t > 0), (n_c > 0) + (n_t > 0), len(_active_mines(zone)),
+    )
+
+
+def _shape(p_count: int, n_count: int, n_mines: int) -> tuple[int, int]:
+    """(rows, max_cols) from icon counts of the P:, N: and mines rows."""
     rows = 0
     max_cols = 0
-    pt = zone.player_towns
-    nt = zone.neutral_towns
-
-    p_count = (_int_val(pt.min_castles) > 0) + (_int_val(pt.min_towns) > 0)
     if p_count > 0:
         rows += 1
         max_cols = max(max_cols, p_count)
-
-    n_count = (_int_val(nt.min_castles) > 0) + (_int_val(nt.min_towns) > 0)
     if n_count > 0:
         rows += 1
         max_cols = max(max_cols, n_count)
-
-    mines = _active_mines(zone)
-    if mines:
-        rows += math.ceil(len(mines) / _COLS)
-        max_cols = max(max_cols, min(len(mines), _COLS))
-
+    if n_mines:
+        rows += (n_mines + _COLS - 1) // _COLS
+        max_cols = max(max_cols, min(n_mines, _COLS))
     return rows, max_cols
 
 
-def zone_size(zone: Zone) -> tuple[float, float]:
-    """Calculate zone pixel size - proportional to base_size, fits content."""
+@lru_cache(maxsize=128)
+def _base_scale(base_size: str) -> float:
+    """Pixel scale for a raw base_size cell (templates reuse a handful)."""
     try:
-        base = int(zone.base_size) if zone.base_size.strip() else 5
+        base = int(base_size) if base_size.strip() else 5
     except ValueError:
         base = 5
+    return math.sqrt(max(base, 1)) * ZONE_SIZE_SCALE
 
+
+def zone_size(zone: Zone) -> tuple[float, float]:
+    """Calculate zone pixel size - proportional to base_size, fits content."""
     rows, max_cols = _content_metrics(zone)
-    scale = math.sqrt(max(base, 1)) * ZONE_SIZE_SCALE
+    side = _side_for(zone.base_size, rows, max_cols, _header_h(), _row_h())
+    return side, side
+
+
+@lru_cache(maxsize=256)
+def _side_for(
+    base_size: str, rows: int, max_cols: int, header_h: int, row_h: int,
+) -> float:
+    """Square side length for a content shape; many zones share one."""
+    scale = _base_scale(base_size)
 
     # Width: header needs chest + treasure text + gap + swords
     header_w = _ICO + 8 + 80 + 20 + _ICO  # chest + val + gap + swords
@@ -179,61 +244,146 @@ def zone_size(zone: Zone) -> tuple[float, float]:
     w = max(header_w + _MARGIN * 2, content_w, scale * 3, 160)
 
     # Height: header + content rows + ID line + margins
-    content_h = _header_h() + rows * _row_h() + _MARGIN * 2 + 40
+    content_h = header_h + rows * row_h + _MARGIN * 2 + 40
     h = max(content_h, scale * 2, 110)
 
     # Keep zones square
-    side = max(w, h)
-    return side, side
+    return max(w, h)
+
+
+@dataclass
+class _ZoneDerived:
+    """Values paint() needs, computed once per refresh instead of per frame."""
+
+    color: QColor
+    border_rgba: int  # color darkened by the theme's zone_border_darken
+    dark_bg: bool
+    tval: int
+    strength: int
+    mines: list[tuple[str, str]]  # (resource, preformatted count label)
+    player_castles: int
+    player_towns: int
+    neutral_castles: int
+    neutral_towns: int
+    id_text: str
+    is_junction: bool
+    is_computer: bool
+    side: float  # Square item size, same as zone_size()
+
+    @property
+    def has_towns(self) -> bool:
+        return bool(
+            self.player_castles or self.player_towns
+            or self.neutral_castles or self.neutral_towns
+        )
+
 
+def _derive(zone: Zone) -> _ZoneDerived:
+    # Parse each field once; color and size reuse the parsed values
+    tval = _treasure_value(zone)
+    color, dark_bg = _zone_color(zone, tval)
+    p_c, p_t, n_c, n_t = _town_counts(zone)
+    mines = _active_mines(zone)
+    rows, max_cols = _shape(
+        (p_c > 0) + (p_t > 0), (n_c > 0) + (n_t > 0), len(mines),
+    )
+    return _ZoneDerived(
+        color=color,
+        border_rgba=color.darker(_theme().zone_border_darken).rgba(),
+        dark_bg=dark_bg,
+        tval=tval,
+        strength=_monster_strength(zone),
+        mines=[
+            (res, f"{mc}/{md}" if md > 0 else str(mc))
+            for res, mc, md in mines
+        ],
+        player_castles=p_c,
+        player_towns=p_t,
+        neutral_castles=n_c,
+        neutral_towns=n_t,
+        id_text=zone.id.strip(),
+        is_junction=zone.junction.strip().lower() == "x",
+        is_computer=zone.computer_start.strip().lower() == "x",
+        side=_side_for(zone.base_size, rows, max_cols, _header_h(), _row_h()),
+    )
 
-def _is_dark_bg(color: QColor) -> bool:
-    brightness = color.red() * 0.299 + color.green() * 0.587 + color.blue() * 0.114
-    return brightness < 150
 
+_JUNCTION_ID_SHADOW = QColor(0, 0, 0, 160).rgba()
+_JUNCTION_RIM = QColor(120, 120, 120).rgba()
+_SHADOW_BRUSHES = tuple(
+    (spread, QBrush(QColor(0, 0, 0, alpha))) for spread, alpha in _SHADOW_LAYERS
+)
 
-def _make_font(size: int, bold: bool = True, extra_bold: bool = False) -> QFont:
-    if extra_bold:
-        weight = QFont.Weight.ExtraBold
-    elif bold:
-        weight = QFont.Weight.Bold
+
+@lru_cache(maxsize=256)
+def _static_text(text: str, font: QFont) -> QStaticText:
+    """Pre-laid-out text for labels that repeat every paint (IDs, "P:")."""
+    st = QStaticText(text)
+    st.setTextFormat(Qt.TextFormat.PlainText)
+    st.prepare(font=font)
+    return st
+
+
+def _static_pos(
+    st: QStaticText, box: tuple[float, float, float, float], flags,
+) -> tuple[float, float]:
+    """Top-left (x, y) placing ``st`` in the (x, y, w, h) ``box`` per ``flags``.
+
+    Boxes are plain tuples so paint() doesn't allocate a QRectF per label.
+    """
+    bx, by, bw, bh = box
+    size = st.size()
+    if flags & Qt.AlignmentFlag.AlignRight:
+        x = bx + bw - size.width()
+    elif flags & Qt.AlignmentFlag.AlignHCenter:
+        x = bx + (bw - size.width()) / 2
     else:
-        weight = QFont.Weight.Normal
-    f = QFont("Helvetica Neue", size, weight)
-    f.setStyleHint(QFont.StyleHint.SansSerif)
-    return f
+        x = bx
+    if flags & Qt.AlignmentFlag.AlignBottom:
+        y = by + bh - size.height()
+    elif flags & Qt.AlignmentFlag.AlignVCenter:
+        y = by + (bh - size.height()) / 2
+    else:
+        y = by
+    return x, y
 
 
-def _draw_text(
-    painter: QPainter, font: QFont, rect: QRectF, flags: int, text: str,
-    dark_bg: bool = True,
+def _draw_static_text(
+    painter: QPainter, font: QFont, box: tuple[float, float, float, float],
+    flags, text: str, dark_bg: bool = True,
 ) -> None:
+    """Draw text with an optional 1px shadow, from a cached QStaticText layout."""
+    st = _static_text(text, font)
+    x, y = _static_pos(st, box, flags)
     painter.setFont(font)
     t = _theme()
     if dark_bg:
-        # Text shadow for readability
         if t.text_shadow:
-            painter.setPen(QPen(QColor(0, 0, 0, 120)))
-            painter.drawText(rect.adjusted(1, 1, 1, 1), flags, text)
-        fg = QColor(255, 255, 255)
+            painter.setPen(cached_pen(TEXT_SHADOW))
+            painter.drawStaticText(QPointF(x + 1, y + 1), st)
+        fg = TEXT_LIGHT
     else:
-        fg = QColor(30, 30, 30)
-    painter.setPen(QPen(fg))
-    painter.drawText(rect, flags, text)
+        fg = TEXT_DARK
+    painter.setPen(cached_pen(fg))
+    painter.drawStaticText(QPointF(x, y), st)
 
 
 def _draw_icon_with_count(
     painter: QPainter, draw_fn, ix: float, iy: float,
-    icon_size: float, count: str, dark_bg: bool,
+    icon_size: float, count: str, dark_bg: bool, *draw_args,
 ) -> None:
-    """Draw an icon with its count centered below it."""
-    draw_fn(painter, ix, iy, icon_size)
+    """Draw an icon with its count centered below it.
+
+    Extra positional arguments are passed through to ``draw_fn`` after the
+    size, e.g. the resource name for ``draw_mine``.
+    """
+    draw_fn(painter, ix, iy, icon_size, *draw_args)
     t = _theme()
     # Count text centered below icon (extra bold for readability)
     count_h = max(t.font_count + 6, 26)
-    count_rect = QRectF(ix - 4, iy + icon_size + 2, icon_size + 8, count_h)
-    _draw_text(
-        painter, _make_font(t.font_count, extra_bold=True), count_rect,
+    count_box = (ix - 4, iy + icon_size + 2, icon_size + 8, count_h)
+    _draw_static_text(
+        painter, make_font(t.font_count, extra_bold=True), count_box,
         Qt.AlignmentFlag.AlignHCenter | Qt.AlignmentFlag.AlignTop,
         count, dark_bg,
     )
@@ -243,38 +393,47 @@ class ZoneItem(QGraphicsRectItem):
     """A draggable zone rectangle with content icons."""
 
     def __init__(self, zone: Zone) -> None:
-        w, h = zone_size(zone)
-        super().__init__(0, 0, w, h)
+        d = _derive(zone)
+        super().__init__(0, 0, d.side, d.side)
         self.zone = zone
-        self._color = _zone_color(zone)
+        self._d = d
+        self._on_moved = None  # Scene's zone_moved, set on scene change
 
         self.setFlags(
             QGraphicsItem.GraphicsItemFlag.ItemIsMovable
             | QGraphicsItem.GraphicsItemFlag.ItemIsSelectable
             | QGraphicsItem.GraphicsItemFlag.ItemSendsGeometryChanges
+            # Populate option.exposedRect so paint() can skip hidden rows
+            | QGraphicsItem.GraphicsItemFlag.ItemUsesExtendedStyleOption
         )
+        # Zone content only changes on refresh()/selection/zoom, so let Qt
+        # reuse a rasterized pixmap when panning or moving other items
+        self.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
         self.setCursor(Qt.CursorShape.PointingHandCursor)
         self.setZValue(1)
 
-        shadow = QGraphicsDropShadowEffect()
-        shadow.setBlurRadius(14)
-        shadow.setOffset(3, 4)
-        shadow.setColor(QColor(0, 0, 0, 55))
-        self.setGraphicsEffect(shadow)
-
         self._update_appearance()
 
+    @property
+    def zone_key(self) -> str:
+        """Stripped zone ID as of the last refresh; the scene's dict key."""
+        return self._d.id_text
+
     def refresh(self) -> None:
-        self._color = _zone_color(self.zone)
-        w, h = zone_size(self.zone)
-        self.setRect(0, 0, w, h)
+        self._d = _derive(self.zone)
+        self.setRect(0, 0, self._d.side, self._d.side)
         self._update_appearance()
         self.update()
 
     def _update_appearance(self) -> None:
         t = _theme()
-        self.setBrush(QBrush(self._color))
-        self.setPen(QPen(self._color.darker(t.zone_border_darken), t.zone_border_width))
+        d = self._d
+        self.setBrush(cached_brush(d.color.rgba()))
+        # The item pen only drives boundingRect (paint() draws its own border),
+        # so size it for the thicker selected border to keep partial repaints
+        # covering the whole outline
+        border_w = max(t.zone_border_width, t.zone_selected_border_width)
+        self.setPen(cached_pen(d.border_rgba, border_w))
 
     def paint(
         self,
@@ -282,72 +441,120 @@ class ZoneItem(QGraphicsRectItem):
         option: QStyleOptionGraphicsItem,
         widget: QWidget | None = None,
     ) -> None:
+        lod = option.levelOfDetailFromTransform(painter.worldTransform())
+        if lod * self.rect().width() < _TINY_ZONE_PX:
+            # Corners, rim and outline are sub-pixel at this size
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing, False)
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(cached_brush(self._d.color.rgba()))
+            painter.drawRect(self.rect())
+            return
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        if lod >= _LOD_OUTLINE:
+            self._paint_shadow(painter)
+        exposed = option.exposedRect
+        if not exposed.intersects(self.rect()):
+            return  # Only the shadow margin needs repainting
         self._paint_background(painter)
 
         scene = self.scene()
         mode = getattr(scene, 'display_mode', DisplayMode.DETAILS)
         if mode == DisplayMode.ZONE_ID:
+            # The big centered ID stays legible when zoomed out
             self._paint_zone_id(painter)
-        else:
-            self._paint_details(painter)
+        elif lod >= _LOD_OUTLINE:
+            self._paint_details(painter, exposed, with_rows=lod >= _LOD_FULL)
+
+    def boundingRect(self) -> QRectF:
+        # Grow down/right to cover the painted drop shadow
+        e = _SHADOW_EXTENT
+        return super().boundingRect().adjusted(
+            -e, -e, _SHADOW_DX + e, _SHADOW_DY + e,
+        )
+
+    def _paint_shadow(self, painter: QPainter) -> None:
+        corner_r = _theme().zone_corner_radius
+        shadow = self.rect().translated(_SHADOW_DX, _SHADOW_DY)
+        painter.setPen(Qt.PenStyle.NoPen)
+        for spread, brush in _SHADOW_BRUSHES:
+            r = corner_r + spread
+            painter.setBrush(brush)
+            painter.drawRoundedRect(
+                shadow.adjusted(-spread, -spread, spread, spread), r, r,
+            )
 
     def _paint_background(self, painter: QPainter) -> None:
         t = _theme()
         rect = self.rect()
         corner_r = t.zone_corner_radius
-        is_junction = self.zone.junction.strip().lower() == "x"
+        d = self._d
+        fill = cached_brush(d.color.rgba())
+        is_junction = d.is_junction
         if is_junction:
             rim_w = min(rect.width(), rect.height()) * 0.16
             painter.setPen(Qt.PenStyle.NoPen)
-            painter.setBrush(QBrush(QColor(120, 120, 120)))
+            painter.setBrush(cached_brush(_JUNCTION_RIM))
             painter.drawRoundedRect(rect, corner_r, corner_r)
             inner = rect.adjusted(rim_w, rim_w, -rim_w, -rim_w)
             inner_r = max(corner_r - rim_w * 0.5, 1)
-            painter.setBrush(QBrush(self._color))
+            painter.setBrush(fill)
             painter.drawRoundedRect(inner, inner_r, inner_r)
         if self.isSelected():
-            painter.setPen(QPen(SELECTION_COLOR, t.zone_selected_border_width))
-            painter.setBrush(Qt.BrushStyle.NoBrush if is_junction else QBrush(self._color))
+            painter.setPen(
+                cached_pen(SELECTION_COLOR.rgba(), t.zone_selected_border_width)
+            )
+            painter.setBrush(Qt.BrushStyle.NoBrush if is_junction else fill)
             painter.drawRoundedRect(rect, corner_r, corner_r)
         elif not is_junction:
-            painter.setPen(QPen(self._color.darker(t.zone_border_darken), t.zone_border_width))
-            painter.setBrush(QBrush(self._color))
+            painter.setPen(cached_pen(d.border_rgba, t.zone_border_width))
+            painter.setBrush(fill)
             painter.drawRoundedRect(rect, corner_r, corner_r)
 
     def _paint_zone_id(self, painter: QPainter) -> None:
         rect = self.rect()
-        dark_bg = _is_dark_bg(self._color)
+        d = self._d
         font_size = int(min(rect.width(), rect.height()) * 0.45)
-        font = _make_font(font_size, extra_bold=True)
-        _draw_text(
-            painter, font, rect,
+        font = make_font(font_size, extra_bold=True)
+        _draw_static_text(
+            painter, font, rect.getRect(),
             Qt.AlignmentFlag.AlignCenter,
-            self.zone.id.strip(), dark_bg,
+            d.id_text, d.dark_bg,
         )
 
-    def _paint_details(self, painter: QPainter) -> None:
+    def _paint_details(
+        self, painter: QPainter, exposed: QRectF, with_rows: bool = True,
+    ) -> None:
         t = _theme()
         rect = self.rect()
-        zone = self.zone
-        dark_bg = _is_dark_bg(self._color)
+        d = self._d
+        dark_bg = d.dark_bg
 
         ox = rect.x() + _MARGIN
         oy = rect.y() + _MARGIN
+        row_h = _row_h()
+
+        # Horizontal bands outside the exposed rect are clipped anyway, so
+        # skip their drawing calls (padded by a margin for icon overhang)
+        ex_top = exposed.top() - _MARGIN
+        ex_bottom = exposed.bottom() + _MARGIN
+
+        def visible(y: float, h: float) -> bool:
+            return y < ex_bottom and y + h > ex_top
 
         # ── Header row: chest+treasure (left), swords (right) ──
-        tval = _treasure_value(zone)
-        strength = _monster_strength(zone)
+        tval = d.tval
+        strength = d.strength
         hx = ox
+        header_visible = visible(oy, _header_h())
 
         # Calculate swords position first so we can constrain treasure label
         sx = rect.x() + rect.width() - _MARGIN - _ICO if strength > 0 else 0
 
         # Draw swords first so treasure text renders on top if they overlap
-        if strength > 0:
+        if strength > 0 and header_visible:
             draw_swords(painter, sx, oy, _ICO, strength)
 
-        if tval > 0:
+        if tval > 0 and header_visible:
             draw_treasure_chest(painter, hx, oy, _ICO)
             hx += _ICO + 8
             # Constrain label width to not overlap with swords
@@ -361,17 +568,17 @@ class ZoneItem(QGraphicsRectItem):
         # ── Zone ID (bottom-right) ───────────────────────────
         id_h = 34
         id_y = rect.y() + rect.height() - _MARGIN - id_h
-        is_junction = zone.junction.strip().lower() == "x"
-        is_computer = zone.computer_start.strip().lower() == "x"
+        is_junction = d.is_junction
+        is_computer = d.is_computer
 
         # Measure ID text width to position PC icon correctly
-        id_text = zone.id.strip()
-        id_font = _make_font(t.font_zone_id)
-        from PySide6.QtGui import QFontMetrics
-        id_fm = QFontMetrics(id_font)
-        id_text_w = id_fm.horizontalAdvance(id_text)
+        id_text = d.id_text
+        id_font = make_font(t.font_zone_id)
+        id_static = _static_text(id_text, id_font)
+        id_text_w = id_static.size().width()
+        id_visible = visible(id_y, id_h)
 
-        if is_computer:
+        if is_computer and id_visible:
             pc_size = 24
             pc_x = rect.x() + rect.width() - _MARGIN - id_text_w - pc_size - 8
             pc_y = id_y + (id_h - pc_size) / 2
@@ -379,115 +586,117 @@ class ZoneItem(QGraphicsRectItem):
 
         # Junction zones: ID sits over the dark rim, so force white text
         # with a dark shadow for readability regardless of inner fill color
-        id_rect = QRectF(ox, id_y, rect.width() - _MARGIN * 2, id_h)
+        id_box = (ox, id_y, rect.width() - _MARGIN * 2, id_h)
         id_flags = Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
-        if is_junction:
+        if id_visible and is_junction:
+            id_x, id_y = _static_pos(id_static, id_box, id_flags)
             painter.setFont(id_font)
-            painter.setPen(QPen(QColor(0, 0, 0, 160)))
-            shadow_rect = id_rect.translated(1, 1)
-            painter.drawText(shadow_rect, id_flags, id_text)
-            painter.setPen(QPen(QColor(255, 255, 255)))
-            painter.drawText(id_rect, id_flags, id_text)
-        else:
-            _draw_text(painter, id_font, id_rect, id_flags, id_text, dark_bg)
+            painter.setPen(cached_pen(_JUNCTION_ID_SHADOW))
+            painter.drawStaticText(QPointF(id_x + 1, id_y + 1), id_static)
+            painter.setPen(cached_pen(TEXT_LIGHT))
+            painter.drawStaticText(QPointF(id_x, id_y), id_static)
+        elif id_visible:
+            _draw_static_text(
+                painter, id_font, id_box, id_flags, id_text, dark_bg,
+            )
 
         # ── Content rows: icons with counts below ────────────
+        if not with_rows:
+            return
         cy = oy + _header_h()
         cx = ox
 
-        if _has_towns(zone):
-            pt = zone.player_towns
-            nt = zone.neutral_towns
-            label_font = _make_font(t.font_label)
-            fg = QColor(255, 255, 255) if dark_bg else QColor(30, 30, 30)
+        if d.has_towns:
+            label_font = make_font(t.font_label)
+            label_pen = cached_pen(TEXT_LIGHT if dark_bg else TEXT_DARK)
             label_w = 38
 
-            has_player = (
-                _int_val(pt.min_castles) > 0 or _int_val(pt.min_towns) > 0
-            )
-            has_neutral = (
-                _int_val(nt.min_castles) > 0 or _int_val(nt.min_towns) > 0
-            )
+            has_player = d.player_castles > 0 or d.player_towns > 0
+            has_neutral = d.neutral_castles > 0 or d.neutral_towns > 0
 
             # Player buildings row
-            if has_player:
+            if has_player and visible(cy, row_h):
                 painter.setFont(label_font)
-                painter.setPen(QPen(fg))
-                painter.drawText(
-                    QRectF(cx, cy, label_w, _ICO),
-                    Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter,
-                    "P:",
+                painter.setPen(label_pen)
+                label_st = _static_text("P:", label_font)
+                lx, ly = _static_pos(
+                    label_st, (cx, cy, label_w, _ICO),
+                    Qt.AlignmentFlag.AlignVCenter,
                 )
+                painter.drawStaticText(QPointF(lx, ly), label_st)
                 ix = cx + label_w
 
-                p_c = _int_val(pt.min_castles)
+                p_c = d.player_castles
                 if p_c > 0:
                     _draw_icon_with_count(
                         painter, draw_castle, ix, cy,
                         _ICO, str(p_c), dark_bg)
                     ix += _CELL_W
 
-                p_t = _int_val(pt.min_towns)
+                p_t = d.player_towns
                 if p_t > 0:
                     _draw_icon_with_count(
                         painter, draw_town, ix, cy,
                         _ICO, str(p_t), dark_bg)
-                cy += _row_h()
+            if has_player:
+                cy += row_h
 
             # Neutral buildings row
-            if has_neutral:
+            if has_neutral and visible(cy, row_h):
                 painter.setFont(label_font)
-                painter.setPen(QPen(fg))
-                painter.drawText(
-                    QRectF(cx, cy, label_w, _ICO),
-                    Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter,
-                    "N:",
+                painter.setPen(label_pen)
+                label_st = _static_text("N:", label_font)
+                lx, ly = _static_pos(
+                    label_st, (cx, cy, label_w, _ICO),
+                    Qt.AlignmentFlag.AlignVCenter,
                 )
+                painter.drawStaticText(QPointF(lx, ly), label_st)
                 ix = cx + label_w
 
-                n_c = _int_val(nt.min_castles)
+                n_c = d.neutral_castles
                 if n_c > 0:
                     _draw_icon_with_count(
                         painter, draw_castle, ix, cy,
                         _ICO, str(n_c), dark_bg)
                     ix += _CELL_W
 
-                n_t = _int_val(nt.min_towns)
+                n_t = d.neutral_towns
                 if n_t > 0:
                     _draw_icon_with_count(
                         painter, draw_town, ix, cy,
                         _ICO, str(n_t), dark_bg)
-                cy += _row_h()
+            if has_neutral:
+                cy += row_h
 
         # Resource mines: icon on top, count below
-        mines = _active_mines(zone)
+        mines = d.mines
         if mines:
-            for i, (res, mc, md) in enumerate(mines):
+            for i, (res, label) in enumerate(mines):
                 col = i % _COLS
                 if i > 0 and col == 0:
-                    cy += _row_h()
+                    cy += row_h
+                if not visible(cy, row_h):
+                    continue
                 ix = cx + col * _CELL_W
-                label = f"{mc}/{md}" if md > 0 else str(mc)
                 _draw_icon_with_count(
-                    painter,
-                    lambda p, x, y, s, r=res: draw_mine(p, x, y, s, r),
-                    ix, cy, _ICO, label, dark_bg)
-            cy += _row_h()
+                    painter, draw_mine, ix, cy, _ICO, label, dark_bg, res)
+            cy += row_h
 
     def center_point(self):
         rect = self.rect()
         return self.mapToScene(rect.center())
 
     def itemChange(self, change, value):
-        if change == QGraphicsItem.GraphicsItemChange.ItemPositionChange:
+        if change == _ITEM_POSITION_HAS_CHANGED:
+            if self._on_moved is not None:
+                self._on_moved(self)
+        elif change == _ITEM_POSITION_CHANGE:
             scene = self.scene()
             if scene and getattr(scene, 'snap_to_grid', False):
-                from h3tc.editor.constants import GRID_SIZE
                 x = round(value.x() / GRID_SIZE) * GRID_SIZE
                 y = round(value.y() / GRID_SIZE) * GRID_SIZE
                 value = QPointF(x, y)
-        if change == QGraphicsItem.GraphicsItemChange.ItemPositionHasChanged:
-            scene = self.scene()
-            if scene and hasattr(scene, "zone_moved"):
-                scene.zone_moved(self)
+        elif change == _ITEM_SCENE_HAS_CHANGED:
+            # Resolve the move callback once per scene instead of per move
+            self._on_moved = getattr(value, "zone_moved", None)
         return super().itemChange(change, value)
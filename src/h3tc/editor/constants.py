@@ -165,48 +165,15 @@ class ThemeManager(QObject):
 GRID_SIZE = 20
 GRID_MAJOR_EVERY = 5
 
-CANVAS_BG_COLOR = QColor(238, 238, 240)
-GRID_COLOR = QColor(215, 215, 215)
-GRID_MAJOR_COLOR = QColor(185, 185, 185)
-
-CANVAS_MARGIN = 200
-DEFAULT_ZOOM = 1.0
 MIN_ZOOM = 0.05
 MAX_ZOOM = 5.0
 ZOOM_FACTOR = 1.15
 
-ZONE_MIN_WIDTH = 100
-ZONE_MIN_HEIGHT = 60
 ZONE_SIZE_SCALE = 11.0
-ZONE_CORNER_RADIUS = 8
-ZONE_BORDER_WIDTH = 2
-ZONE_SELECTED_BORDER_WIDTH = 3
-ZONE_FONT_SIZE = 16
-ZONE_ID_FONT_SIZE = 18
-
-ZONE_COLORS = {
-    "human_start": {
-        "0": QColor(140, 170, 220),
-        "1": QColor(200, 115, 110),
-        "2": QColor(110, 145, 215),
-        "3": QColor(210, 190, 145),
-        "4": QColor(120, 185, 120),
-        "5": QColor(220, 175, 100),
-        "6": QColor(170, 135, 205),
-        "7": QColor(110, 195, 195),
-        "8": QColor(210, 160, 185),
-    },
-    "computer_start": QColor(100, 149, 237),
-    "treasure": QColor(210, 180, 140),
-    "junction": QColor(218, 165, 32),
-    "default": QColor(180, 180, 180),
-}
 
 CONNECTION_COLOR = QColor(80, 80, 80)
 CONNECTION_SELECTED_COLOR = QColor(30, 120, 220)
 CONNECTION_WIDTH = 3.0
 CONNECTION_WIDE_WIDTH = 6.0
-CONNECTION_LABEL_FONT_SIZE = 28
-CONNECTION_ARROW_SIZE = 0
 
 SELECTION_COLOR = QColor(30, 120, 220)
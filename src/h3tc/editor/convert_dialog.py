@@ -61,6 +61,8 @@ class ConvertDialog(QDialog):
 
         # Output format
         self._output_format_combo = QComboBox()
+        for fmt_id, (display_name, _, _) in _FORMATS.items():
+            self._output_format_combo.addItem(display_name, fmt_id)
         form.addRow("Output format:", self._output_format_combo)
 
         # Pack name (hidden by default)
@@ -126,13 +128,18 @@ class ConvertDialog(QDialog):
             self._update_convert_button()
             return
 
-        # Rebuild output format combo (exclude detected input format)
-        self._output_format_combo.blockSignals(True)
-        self._output_format_combo.clear()
-        for fmt_id, (display_name, _, _) in _FORMATS.items():
-            if fmt_id != self._input_format_id:
-                self._output_format_combo.addItem(display_name, fmt_id)
-        self._output_format_combo.blockSignals(False)
+        # Hide and disable the detected input format in the output combo
+        combo = self._output_format_combo
+        model = combo.model()
+        first_allowed = -1
+        for i in range(combo.count()):
+            same = combo.itemData(i) == self._input_format_id
+            combo.view().setRowHidden(i, same)
+            model.item(i).setEnabled(not same)
+            if not same and first_allowed < 0:
+                first_allowed = i
+        if combo.currentData() == self._input_format_id:
+            combo.setCurrentIndex(first_allowed)
 
         # Auto-suggest output path and update pack name visibility
         self._on_output_format_changed()
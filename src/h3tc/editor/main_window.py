@@ -1,8 +1,11 @@
 """Main window for the SOD Visual Template Editor."""
 
+from functools import lru_cache
 from pathlib import Path
 
-from PySide6.QtCore import Qt
+from PySide6.QtCore import (
+    QObject, QRunnable, QSignalBlocker, QThreadPool, Qt, QTimer, Signal,
+)
 from PySide6.QtGui import QAction, QActionGroup, QKeySequence
 from PySide6.QtWidgets import (
     QComboBox,
@@ -24,6 +27,7 @@ from h3tc.editor.canvas.view import TemplateView
 from h3tc.editor.models.editor_state import EditorState
 from h3tc.editor.models.layout_store import load_layout, save_layout
 from h3tc.editor.models.theme_store import load_themes, save_themes
+from h3tc.editor.panels.binding import is_flag_set
 from h3tc.editor.panels.connection_panel import ConnectionPanel
 from h3tc.editor.panels.map_panel import MapPanel
 from h3tc.editor.panels.map_selector import MapSelector
@@ -38,15 +42,29 @@ from h3tc.models import (
     Zone,
     ZoneOptions,
 )
-from h3tc.enums import MONSTER_FACTIONS_SOD, TERRAINS_SOD
-from h3tc.converters.hota_to_sod import hota_to_sod
-from h3tc.converters.sod_to_hota import sod_to_hota
-from h3tc.converters.hota_to_hota18 import hota_to_hota18
-from h3tc.converters.hota18_to_hota import hota18_to_hota
-from h3tc.formats import detect_format, get_parser
-from h3tc.writers.sod import SodWriter
-from h3tc.writers.hota import HotaWriter
-from h3tc.writers.hota18 import Hota18Writer
+
+
+class _SidecarSignals(QObject):
+    finished = Signal(int, object)  # open generation, layouts by map name
+
+
+class _SidecarWorker(QRunnable):
+    """Reads and decodes a layout sidecar off the UI thread."""
+
+    def __init__(
+        self, filepath: Path, generation: int, signals: _SidecarSignals
+    ) -> None:
+        super().__init__()
+        self._filepath = filepath
+        self._generation = generation
+        self._signals = signals
+
+    def run(self) -> None:
+        try:
+            layouts = load_layout(self._filepath)
+        except Exception:
+            layouts = {}  # Malformed sidecar; fall back to auto-layout
+        self._signals.finished.emit(self._generation, layouts)
 
 
 class MainWindow(QMainWindow):
@@ -59,7 +77,19 @@ class MainWindow(QMainWindow):
         self.resize(1280, 800)
 
         self._state = EditorState()
-        self._writer = SodWriter()
+        self._writer = None  # SodWriter, created on first save
+        # map index -> {zone_id: (x, y)}, kept for every map in the pack so
+        # switching maps and saving don't lose positions of unloaded maps.
+        # Keyed by index because map names can repeat within a pack.
+        self._layouts_cache: dict[int, dict[str, tuple[float, float]]] = {}
+        # map index -> built scene, so revisiting a map swaps scenes on the
+        # view instead of rebuilding every item
+        self._scenes: dict[int, TemplateScene] = {}
+        self._last_title_key: tuple | None = None  # inputs of the shown title
+        # Bumped per open so a late sidecar from a previous file is ignored
+        self._open_generation = 0
+        self._sidecar_signals = _SidecarSignals(self)
+        self._sidecar_signals.finished.connect(self._on_sidecar_loaded)
 
         self._build_actions()
         self._build_toolbar()
@@ -69,6 +99,12 @@ class MainWindow(QMainWindow):
         self._connect_signals()
         self._update_title()
 
+        # One reusable timer fits the view shortly after a fresh scene loads
+        self._fit_timer = QTimer(self)
+        self._fit_timer.setSingleShot(True)
+        self._fit_timer.setInterval(50)
+        self._fit_timer.timeout.connect(self._view.zoom_to_fit)
+
         # Load persisted themes (all 3 presets)
         result = load_themes()
         if result:
@@ -292,10 +328,7 @@ class MainWindow(QMainWindow):
         ThemeManager().theme_changed.connect(self._on_theme_changed_sync)
 
         # Scene selection
-        self._scene.zone_selected.connect(self._on_zone_selected)
-        self._scene.connection_selected.connect(self._on_connection_selected)
-        self._scene.selection_cleared.connect(self._on_selection_cleared)
-        self._scene.scene_modified.connect(self._on_modified)
+        self._connect_scene(self._scene)
 
         # Panels
         self._zone_panel.zone_changed.connect(self._on_zone_panel_changed)
@@ -316,6 +349,10 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "Error", f"File not found: {filepath}")
             return
 
+        # Parsers and converters load on first open, not at startup
+        from h3tc.converters.hota_to_sod import hota_to_sod
+        from h3tc.formats import detect_format
+
         try:
             parser = detect_format(filepath)
             pack = parser.parse(filepath)
@@ -343,43 +380,105 @@ class MainWindow(QMainWindow):
         self._state.current_map_index = 0
         self._state.mark_clean()
 
-        # Load layout sidecar, with HOTA image_settings as fallback
-        layouts = load_layout(filepath)
-        for map_name, positions in hota_positions.items():
-            if map_name not in layouts:
-                layouts[map_name] = positions
+        # Show HOTA image_settings positions right away; the layout sidecar
+        # is decoded in the background and overrides them when it arrives
+        self._layouts_cache = {
+            i: hota_positions[m.name] for i, m in enumerate(pack.maps)
+            if m.name in hota_positions
+        }
+        self._release_scenes()
+        self._open_generation += 1
+        QThreadPool.globalInstance().start(
+            _SidecarWorker(filepath, self._open_generation, self._sidecar_signals)
+        )
 
         # Setup map selector
         self._map_selector.set_pack(pack)
         self._map_selector.set_visible_if_multi(pack)
 
         # Load first map
-        self._load_current_map(layouts)
+        self._load_current_map()
         self._update_title()
         fmt = f"{source_format} → SOD" if source_format != "SOD" else "SOD"
         self._statusbar.showMessage(
             f"Opened: {filepath.name} ({len(pack.maps)} map(s), {fmt})"
         )
 
-    def _load_current_map(
-        self, layouts: dict[str, dict[str, tuple[float, float]]] | None = None
-    ) -> None:
+    def _release_scenes(self) -> None:
+        """Drop the cached scenes of the previous pack."""
+        for scene in self._scenes.values():
+            scene.invalidate()
+        self._scenes = {}
+
+    def _load_current_map(self) -> None:
         tm = self._state.current_map
         if not tm:
             return
 
-        positions = None
-        if layouts and tm.name in layouts:
-            positions = layouts[tm.name]
-
-        self._scene.load_map(tm, positions)
+        idx = self._state.current_map_index
+        scene = self._scenes.get(idx)
+        cached = scene is not None
+        if not cached:
+            scene = TemplateScene()
+            scene.load_map(tm, self._layouts_cache.get(idx))
+            self._scenes[idx] = scene
+        self._set_active_scene(scene)
         self._map_panel.set_map(tm)
         self._panel_stack.setCurrentWidget(self._empty_panel)
 
-        # Fit view after loading
-        from PySide6.QtCore import QTimer
+        if cached:
+            self._view.zoom_to_fit()
+        else:
+            # Fit view after loading
+            self._fit_timer.start()
 
-        QTimer.singleShot(50, self._view.zoom_to_fit)
+    def _on_sidecar_loaded(
+        self, generation: int, layouts: dict[str, dict[str, tuple[float, float]]]
+    ) -> None:
+        if generation != self._open_generation or not self._state.pack:
+            return  # Another file has been opened (or a new one created) since
+        for idx, m in enumerate(self._state.pack.maps):
+            positions = layouts.get(m.name)
+            if positions is None:
+                continue
+            self._layouts_cache[idx] = positions
+            scene = self._scenes.get(idx)
+            # Once edited (dragged, re-IDed) the scene keeps its own layout;
+            # the sidecar's IDs may no longer match its zones
+            if scene is None or scene.modified_since_load:
+                continue
+            scene.apply_positions(positions)
+            if scene is self._scene and not self._view.user_navigated:
+                self._fit_timer.start()
+
+    def _connect_scene(self, scene: TemplateScene) -> None:
+        scene.zone_selected.connect(self._on_zone_selected)
+        scene.connection_selected.connect(self._on_connection_selected)
+        scene.selection_cleared.connect(self._on_selection_cleared)
+        scene.scene_modified.connect(self._on_modified)
+        scene.layout_applied.connect(self._view.zoom_to_fit)
+
+    def _disconnect_scene(self, scene: TemplateScene) -> None:
+        scene.zone_selected.disconnect(self._on_zone_selected)
+        scene.connection_selected.disconnect(self._on_connection_selected)
+        scene.selection_cleared.disconnect(self._on_selection_cleared)
+        scene.scene_modified.disconnect(self._on_modified)
+        scene.layout_applied.disconnect(self._view.zoom_to_fit)
+
+    def _set_active_scene(self, scene: TemplateScene) -> None:
+        """Show ``scene`` in the view; only the active scene drives the UI."""
+        old = self._scene
+        if scene is old:
+            return
+        old.clearSelection()
+        self._disconnect_scene(old)
+        # A cached scene may predate the last snap/display-mode toggle
+        scene.snap_to_grid = old.snap_to_grid
+        if scene.display_mode != old.display_mode:
+            scene.display_mode = old.display_mode
+        self._connect_scene(scene)
+        self._view.setScene(scene)
+        self._scene = scene
 
     def _on_new(self) -> None:
         if not self._check_unsaved():
@@ -399,6 +498,9 @@ class MainWindow(QMainWindow):
         self._state.file_path = None
         self._state.current_map_index = 0
         self._state.mark_dirty()
+        self._layouts_cache = {}
+        self._release_scenes()
+        self._open_generation += 1
 
         self._map_selector.set_pack(pack)
         self._map_selector.set_visible_if_multi(pack)
@@ -436,7 +538,15 @@ class MainWindow(QMainWindow):
             self._save_to(Path(path))
 
     def _on_convert(self) -> None:
+        from h3tc.converters.hota18_to_hota import hota18_to_hota
+        from h3tc.converters.hota_to_hota18 import hota_to_hota18
+        from h3tc.converters.hota_to_sod import hota_to_sod
+        from h3tc.converters.sod_to_hota import sod_to_hota
         from h3tc.editor.convert_dialog import ConvertDialog
+        from h3tc.formats import get_parser
+        from h3tc.writers.hota import HotaWriter
+        from h3tc.writers.hota18 import Hota18Writer
+        from h3tc.writers.sod import SodWriter
 
         dialog = ConvertDialog(self)
         if dialog.exec() != ConvertDialog.DialogCode.Accepted:
@@ -477,14 +587,15 @@ class MainWindow(QMainWindow):
         except Exception as e:
             QMessageBox.critical(self, "Conversion Error", f"Failed to convert:\n{e}")
 
-    def _validate_and_fix(self) -> list[str]:
+    def _validate_and_fix(self) -> tuple[list[str], list[Zone]]:
         """Validate all zones and auto-fix missing terrain/monster defaults.
 
-        Returns list of fix descriptions applied.
+        Returns (fix descriptions applied, zones that were modified).
         """
-        fixes = []
+        fixes: list[str] = []
+        touched: dict[int, Zone] = {}  # id(zone) -> zone; models aren't hashable
         if not self._state.pack:
-            return fixes
+            return fixes, []
 
         for tm in self._state.pack.maps:
             # Check zone IDs are sequential 1..N with no gaps/duplicates
@@ -500,6 +611,7 @@ class MainWindow(QMainWindow):
                         id_map[old_id] = new_id
                         changes.append(f"{old_id or '(empty)'} → {new_id}")
                         zone.id = new_id
+                        touched[id(zone)] = zone
                 # Update connection references
                 if id_map:
                     for conn in tm.connections:
@@ -518,38 +630,38 @@ class MainWindow(QMainWindow):
             for zone in tm.zones:
                 zid = zone.id.strip()
 
-                # Check terrain: at least one must be enabled
-                has_terrain = any(
-                    zone.terrains.get(t, "").strip().lower() == "x"
-                    for t in TERRAINS_SOD
-                )
-                # terrain_match counts as having terrain configured
-                if not has_terrain and zone.terrain_match.strip().lower() != "x":
+                # Check terrain: at least one must be enabled.
+                # terrain_match counts as having terrain configured.
+                # Editor maps are SOD-only, so scanning the values covers
+                # exactly the SOD terrain columns.
+                if not is_flag_set(zone.terrain_match) and not any(
+                    map(is_flag_set, zone.terrains.values())
+                ):
                     zone.terrains["Dirt"] = "x"
+                    touched[id(zone)] = zone
                     fixes.append(
                         f"Zone {zid}: no terrain enabled, added Dirt"
                     )
 
-                # Check monsters: at least one faction must be enabled
-                has_monster = any(
-                    zone.monster_factions.get(f, "").strip().lower() == "x"
-                    for f in MONSTER_FACTIONS_SOD
-                )
-                # monster_match counts as having monsters configured
-                if not has_monster and zone.monster_match.strip().lower() != "x":
+                # Check monsters: at least one faction must be enabled.
+                # monster_match counts as having monsters configured.
+                if not is_flag_set(zone.monster_match) and not any(
+                    map(is_flag_set, zone.monster_factions.values())
+                ):
                     zone.monster_factions["Neutral"] = "x"
+                    touched[id(zone)] = zone
                     fixes.append(
                         f"Zone {zid}: no monster faction enabled, added Neutral"
                     )
 
-        return fixes
+        return fixes, list(touched.values())
 
     def _save_to(self, filepath: Path) -> None:
         if not self._state.pack:
             return
 
         # Validate and auto-fix before saving
-        fixes = self._validate_and_fix()
+        fixes, touched = self._validate_and_fix()
         if fixes:
             fix_text = "\n".join(f"  - {f}" for f in fixes)
             QMessageBox.information(
@@ -557,21 +669,25 @@ class MainWindow(QMainWindow):
                 "Auto-corrections Applied",
                 f"The following issues were fixed before saving:\n\n{fix_text}",
             )
-            # Refresh canvas to reflect changes
-            if self._state.current_map:
-                for zone in self._state.current_map.zones:
-                    self._scene.refresh_zone(zone)
+            # Refresh only the fixed zones; fixes span every map, so cached
+            # scenes of other maps need the refresh too
+            for scene in self._scenes.values():
+                scene.refresh_zones(touched)
 
         try:
+            if self._writer is None:
+                from h3tc.writers.sod import SodWriter
+
+                self._writer = SodWriter()
             self._writer.write(self._state.pack, filepath)
 
-            # Save layout sidecar
-            layouts = {}
-            for m in self._state.pack.maps:
-                if m is self._state.current_map:
-                    layouts[m.name] = self._scene.get_zone_positions()
-                # For maps not currently loaded, we'd need stored positions
-                # For now, save current map positions
+            # Save layout sidecar; unvisited maps keep their loaded positions
+            self._store_positions()
+            layouts = {
+                m.name: self._layouts_cache[i]
+                for i, m in enumerate(self._state.pack.maps)
+                if i in self._layouts_cache
+            }
             save_layout(filepath, layouts)
 
             self._state.file_path = filepath
@@ -617,7 +733,7 @@ class MainWindow(QMainWindow):
         # Place near center of current view
         center = self._view.mapToScene(self._view.viewport().rect().center())
         self._scene.add_zone(zone, center.x(), center.y())
-        self._map_panel.set_map(self._state.current_map)
+        self._map_panel.refresh_counts()
         self._statusbar.showMessage(f"Added zone #{next_id}")
 
     def _on_add_connection(self) -> None:
@@ -634,19 +750,15 @@ class MainWindow(QMainWindow):
             )
             return
 
-        z1_id = zone_items[0].zone.id.strip()
-        z2_id = zone_items[1].zone.id.strip()
+        z1_id = zone_items[0].zone_key
+        z2_id = zone_items[1].zone_key
 
         # Check if connection already exists
-        for conn in self._state.current_map.connections:
-            if (
-                (conn.zone1.strip() == z1_id and conn.zone2.strip() == z2_id)
-                or (conn.zone1.strip() == z2_id and conn.zone2.strip() == z1_id)
-            ):
-                self._statusbar.showMessage(
-                    f"Connection already exists between {z1_id} and {z2_id}"
-                )
-                return
+        if self._scene.has_connection(z1_id, z2_id):
+            self._statusbar.showMessage(
+                f"Connection already exists between {z1_id} and {z2_id}"
+            )
+            return
 
         connection = Connection(
             zone1=z1_id,
@@ -657,7 +769,7 @@ class MainWindow(QMainWindow):
             positions=PositionConstraints(),
         )
         self._scene.add_connection(connection)
-        self._map_panel.set_map(self._state.current_map)
+        self._map_panel.refresh_counts()
         self._statusbar.showMessage(f"Added connection {z1_id} - {z2_id}")
 
     def _on_snap_toggled(self, checked: bool) -> None:
@@ -698,9 +810,8 @@ class MainWindow(QMainWindow):
         names = ["Default", "High Contrast", "Custom"]
         current = ThemeManager().theme.name
         if current in names:
-            self._theme_combo.blockSignals(True)
-            self._theme_combo.setCurrentIndex(names.index(current))
-            self._theme_combo.blockSignals(False)
+            with QSignalBlocker(self._theme_combo):
+                self._theme_combo.setCurrentIndex(names.index(current))
 
     def _on_spread_compact(self, factor: float) -> None:
         """Spread or compact zones while preserving viewport center."""
@@ -715,8 +826,7 @@ class MainWindow(QMainWindow):
             return
         self._scene.delete_selected()
         self._panel_stack.setCurrentWidget(self._empty_panel)
-        if self._state.current_map:
-            self._map_panel.set_map(self._state.current_map)
+        self._map_panel.refresh_counts()
         self._statusbar.showMessage("Deleted selected item(s)")
 
     def _on_reid_zones(self, method: str = "dfs") -> None:
@@ -743,7 +853,6 @@ class MainWindow(QMainWindow):
         # Clear panel selection and mark dirty
         self._panel_stack.setCurrentWidget(self._empty_panel)
         self._on_modified()
-        self._map_panel.set_map(self._state.current_map)
 
         changes = [f"{old} → {new}" for old, new in mapping.items() if old != new]
         label = method.upper()
@@ -767,8 +876,7 @@ class MainWindow(QMainWindow):
     # ── Panel Change Callbacks ───────────────────────────────────────────
 
     def _on_zone_panel_changed(self) -> None:
-        self._state.mark_dirty()
-        self._update_title()
+        self._on_modified()
         # Refresh the zone visual on the canvas
         selected = self._scene.selectedItems()
         from h3tc.editor.canvas.zone_item import ZoneItem
@@ -778,8 +886,7 @@ class MainWindow(QMainWindow):
                 self._scene.refresh_zone(item.zone)
 
     def _on_connection_panel_changed(self) -> None:
-        self._state.mark_dirty()
-        self._update_title()
+        self._on_modified()
         selected = self._scene.selectedItems()
         from h3tc.editor.canvas.connection_item import ConnectionItem
 
@@ -788,21 +895,34 @@ class MainWindow(QMainWindow):
                 self._scene.refresh_connection(item.connection)
 
     def _on_modified(self) -> None:
+        self._scene.mark_modified()
+        # Drags and panel edits fire this repeatedly; the title only changes
+        # on the first edit after a clean state
+        if self._state.dirty:
+            return
         self._state.mark_dirty()
         self._update_title()
 
     def _on_map_selected(self, index: int) -> None:
         if not self._state.pack or index < 0:
             return
-        # Save current map positions before switching
-        if self._state.current_map:
-            pass  # TODO: persist positions across map switches
         self._state.current_map_index = index
         self._load_current_map()
 
+    def _store_positions(self) -> None:
+        # Every visited map keeps its scene, so read positions from each;
+        # a background layout may have landed after the user switched away
+        for idx, scene in self._scenes.items():
+            self._layouts_cache[idx] = scene.get_zone_positions()
+
     # ── UI Helpers ───────────────────────────────────────────────────────
 
     def _update_title(self) -> None:
+        state = self._state
+        key = (state.file_path, state.pack is not None, state.dirty)
+        if key == self._last_title_key:
+            return
+        self._last_title_key = key
         title = "H3TC - SOD Template Editor"
         if self._state.file_path:
             title = f"{self._state.file_path.name} - {title}"
@@ -873,7 +993,13 @@ def _make_default_zone(
 
 
 def _default_header_rows() -> list[list[str]]:
-    """Create default SOD header rows."""
+    """Create default SOD header rows (fresh lists, safe to mutate)."""
+    return [list(row) for row in _header_rows_template()]
+
+
+@lru_cache(maxsize=1)
+def _header_rows_template() -> tuple[tuple[str, ...], ...]:
+    """Build the default SOD header rows once; callers copy them."""
     from h3tc.constants import SodCol
 
     row1 = [""] * SodCol.ACTIVE_COLS
@@ -906,4 +1032,4 @@ def _default_header_rows() -> list[list[str]]:
     row3[7] = "Junction"
     row3[8] = "base size"
 
-    return [row1, row2, row3]
+    return tuple(row1), tuple(row2), tuple(row3)
@@ -2,23 +2,52 @@
 
 from pathlib import Path
 
-from h3tc.models import TemplatePack
+from h3tc.models import TemplateMap, TemplatePack
 
 
 class EditorState:
     """Tracks the current editor state."""
 
+    __slots__ = (
+        "_pack", "file_path", "_current_map_index", "_current_map", "dirty",
+    )
+
     def __init__(self) -> None:
-        self.pack: TemplatePack | None = None
+        self._pack: TemplatePack | None = None
         self.file_path: Path | None = None
-        self.current_map_index: int = 0
+        self._current_map_index: int = 0
+        # Resolved from pack + index whenever either is assigned
+        self._current_map: TemplateMap | None = None
         self.dirty: bool = False
 
     @property
-    def current_map(self):
-        if self.pack and 0 <= self.current_map_index < len(self.pack.maps):
-            return self.pack.maps[self.current_map_index]
-        return None
+    def pack(self) -> TemplatePack | None:
+        return self._pack
+
+    @pack.setter
+    def pack(self, pack: TemplatePack | None) -> None:
+        self._pack = pack
+        self._resolve_current_map()
+
+    @property
+    def current_map_index(self) -> int:
+        return self._current_map_index
+
+    @current_map_index.setter
+    def current_map_index(self, index: int) -> None:
+        self._current_map_index = index
+        self._resolve_current_map()
+
+    def _resolve_current_map(self) -> None:
+        pack, idx = self._pack, self._current_map_index
+        if pack and 0 <= idx < len(pack.maps):
+            self._current_map = pack.maps[idx]
+        else:
+            self._current_map = None
+
+    @property
+    def current_map(self) -> TemplateMap | None:
+        return self._current_map
 
     @property
     def has_file(self) -> bool:
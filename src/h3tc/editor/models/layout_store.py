@@ -1,10 +1,11 @@
 """JSON sidecar file for persisting zone visual positions."""
 
 import json
+import os
 from pathlib import Path
 
 _SIDECAR_SUFFIX = ".h3tc-layout.json"
-_VERSION = 1
+_VERSION = 2  # v2 stores positions as [x, y]; v1 used {"x": .., "y": ..}
 
 
 def sidecar_path(template_path: Path) -> Path:
@@ -23,18 +24,22 @@ def load_layout(template_path: Path) -> dict[str, dict[str, tuple[float, float]]
         return {}
 
     try:
-        data = json.loads(path.read_text("utf-8"))
-    except (json.JSONDecodeError, OSError):
+        with path.open("rb") as f:
+            data = json.load(f)
+    except (ValueError, OSError):  # JSONDecodeError and bad UTF-8 included
         return {}
 
-    if data.get("version") != _VERSION:
+    version = data.get("version")
+    if version not in (1, _VERSION):
         return {}
 
     result: dict[str, dict[str, tuple[float, float]]] = {}
     for map_name, map_data in data.get("maps", {}).items():
         zones = {}
         for zone_id, pos in map_data.get("zones", {}).items():
-            if isinstance(pos, dict) and "x" in pos and "y" in pos:
+            if isinstance(pos, list) and len(pos) == 2:
+                zones[zone_id] = (float(pos[0]), float(pos[1]))
+            elif isinstance(pos, dict) and "x" in pos and "y" in pos:
                 zones[zone_id] = (float(pos["x"]), float(pos["y"]))
         result[map_name] = zones
     return result
@@ -46,6 +51,9 @@ def save_layout(
 ) -> None:
     """Save zone positions to sidecar.
 
+    Writes compact JSON to a temporary file and swaps it in, so a crash
+    mid-write leaves the previous sidecar intact.
+
     Args:
         template_path: Path to the .txt template file.
         layouts: Dict mapping map_name -> {zone_id: (x, y)}.
@@ -54,10 +62,18 @@ def save_layout(
     for map_name, zones in layouts.items():
         data["maps"][map_name] = {
             "zones": {
-                zid: {"x": round(x, 1), "y": round(y, 1)}
+                zid: [round(x, 1), round(y, 1)]
                 for zid, (x, y) in zones.items()
             }
         }
 
     path = sidecar_path(template_path)
-    path.write_text(json.dumps(data, indent=2) + "\n", "utf-8")
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    try:
+        with tmp.open("w", encoding="utf-8") as f:
+            json.dump(data, f, separators=(",", ":"))
+            f.write("\n")
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
@@ -2,7 +2,32 @@
 
 from typing import Any, Callable
 
-from PySide6.QtWidgets import QCheckBox, QComboBox, QSpinBox
+from PySide6.QtCore import QSignalBlocker
+from PySide6.QtWidgets import QCheckBox, QComboBox, QLineEdit, QSpinBox
+
+# Exact forms of an enabled flag; nearly every cell is one of these or ""
+_X_MARKERS = frozenset(("x", "X"))
+
+
+def is_flag_set(raw: str) -> bool:
+    """Whether an 'x' flag cell is set, without allocating in the common cases.
+
+    Parsers keep cells unstripped for round-tripping, so padded values
+    still fall back to strip().lower().
+    """
+    return raw in _X_MARKERS or (bool(raw) and raw.strip().lower() == "x")
+
+
+def _parse_int(raw: str) -> int:
+    """Spinbox value for a numeric cell; blank or malformed cells read as 0."""
+    if raw.isdecimal():  # Nearly every cell: plain digits
+        return int(raw)
+    if not raw or raw.isspace():
+        return 0
+    try:
+        return int(raw)  # Padded, signed or otherwise unusual forms
+    except ValueError:
+        return 0
 
 
 def bind_spinbox(
@@ -25,29 +50,20 @@ def bind_spinbox(
         on_change: Optional callback when value changes.
     """
     target = getattr(obj, sub_obj) if sub_obj else obj
+    sync_spinbox(spinbox, target, field, dict_key=dict_key)
 
-    # Read current value
+    # Sub-models are never replaced while a panel is bound, so the target
+    # is resolved once here and each handler only does the one write
     if dict_key is not None:
-        raw = getattr(target, field).get(dict_key, "")
+        def _on_value_changed(new_val: int) -> None:
+            getattr(target, field)[dict_key] = str(new_val) if new_val != 0 else ""
+            if on_change:
+                on_change()
     else:
-        raw = getattr(target, field)
-    try:
-        val = int(raw) if raw.strip() else 0
-    except (ValueError, AttributeError):
-        val = 0
-
-    spinbox.blockSignals(True)
-    spinbox.setValue(val)
-    spinbox.blockSignals(False)
-
-    def _on_value_changed(new_val: int) -> None:
-        t = getattr(obj, sub_obj) if sub_obj else obj
-        if dict_key is not None:
-            getattr(t, field)[dict_key] = str(new_val) if new_val != 0 else ""
-        else:
-            setattr(t, field, str(new_val) if new_val != 0 else "")
-        if on_change:
-            on_change()
+        def _on_value_changed(new_val: int) -> None:
+            setattr(target, field, str(new_val) if new_val != 0 else "")
+            if on_change:
+                on_change()
 
     spinbox.valueChanged.connect(_on_value_changed)
 
@@ -63,25 +79,108 @@ def bind_checkbox(
 ) -> None:
     """Bind a QCheckBox to a str field where 'x' = checked, '' = unchecked."""
     target = getattr(obj, sub_obj) if sub_obj else obj
+    sync_checkbox(checkbox, target, field, dict_key=dict_key)
 
     if dict_key is not None:
-        raw = getattr(target, field).get(dict_key, "")
+        def _on_toggled(checked: bool) -> None:
+            getattr(target, field)[dict_key] = "x" if checked else ""
+            if on_change:
+                on_change()
     else:
-        raw = getattr(target, field)
+        def _on_toggled(checked: bool) -> None:
+            setattr(target, field, "x" if checked else "")
+            if on_change:
+                on_change()
 
-    checkbox.blockSignals(True)
-    checkbox.setChecked(raw.strip().lower() == "x")
-    checkbox.blockSignals(False)
+    checkbox.toggled.connect(_on_toggled)
 
-    def _on_toggled(checked: bool) -> None:
-        t = getattr(obj, sub_obj) if sub_obj else obj
-        val = "x" if checked else ""
-        if dict_key is not None:
-            getattr(t, field)[dict_key] = val
-        else:
-            setattr(t, field, val)
-        if on_change:
-            on_change()
+
+def sync_spinbox(
+    spinbox: QSpinBox, obj: Any, field: str, *, dict_key: str | None = None
+) -> None:
+    """Show obj.<field> (or obj.<field>[dict_key]) without emitting valueChanged."""
+    if dict_key is not None:
+        raw = getattr(obj, field).get(dict_key, "")
+    else:
+        raw = getattr(obj, field)
+    with QSignalBlocker(spinbox):
+        spinbox.setValue(_parse_int(raw))
+
+
+def sync_checkbox(
+    checkbox: QCheckBox, obj: Any, field: str, *, dict_key: str | None = None
+) -> None:
+    """Show an 'x' flag field without emitting toggled."""
+    if dict_key is not None:
+        raw = getattr(obj, field).get(dict_key, "")
+    else:
+        raw = getattr(obj, field)
+    with QSignalBlocker(checkbox):
+        checkbox.setChecked(is_flag_set(raw))
+
+
+def connect_spinbox(
+    spinbox: QSpinBox,
+    resolve: Callable[[], Any],
+    field: str,
+    *,
+    dict_key: str | None = None,
+    on_change: Callable[[], None] | None = None,
+) -> None:
+    """Write spinbox edits to whichever model *resolve* returns at edit time.
+
+    Unlike bind_spinbox this connects once for the widget's lifetime; the
+    panel switches models by changing what *resolve* returns and calling
+    sync_spinbox. Edits are dropped while *resolve* returns None.
+    """
+    if dict_key is not None:
+        def _on_value_changed(new_val: int) -> None:
+            target = resolve()
+            if target is None:
+                return
+            getattr(target, field)[dict_key] = str(new_val) if new_val != 0 else ""
+            if on_change:
+                on_change()
+    else:
+        def _on_value_changed(new_val: int) -> None:
+            target = resolve()
+            if target is None:
+                return
+            setattr(target, field, str(new_val) if new_val != 0 else "")
+            if on_change:
+                on_change()
+
+    spinbox.valueChanged.connect(_on_value_changed)
+
+
+def connect_checkbox(
+    checkbox: QCheckBox,
+    resolve: Callable[[], Any],
+    field: str,
+    *,
+    dict_key: str | None = None,
+    on_change: Callable[[], None] | None = None,
+) -> None:
+    """Write checkbox toggles to whichever model *resolve* returns.
+
+    See connect_spinbox; pair with sync_checkbox when the model changes.
+    """
+    if dict_key is not None:
+        def _on_toggled(checked: bool) -> None:
+            target = resolve()
+            if target is None:
+                return
+            getattr(target, field)[dict_key] = "x" if checked else ""
+            if on_change:
+                on_change()
+    else:
+        def _on_toggled(checked: bool) -> None:
+            target = resolve()
+            if target is None:
+                return
+            setattr(target, field, "x" if checked else "")
+            if on_change:
+                on_change()
 
     checkbox.toggled.connect(_on_toggled)
 
@@ -105,18 +204,17 @@ def bind_combo_index(
     """
     raw = getattr(obj, field).strip()
 
-    combo.blockSignals(True)
-    if values:
-        try:
-            idx = values.index(raw)
-        except ValueError:
-            idx = 0
-        combo.setCurrentIndex(idx)
-    else:
-        idx = combo.findText(raw)
-        if idx >= 0:
+    with QSignalBlocker(combo):
+        if values:
+            try:
+                idx = values.index(raw)
+            except ValueError:
+                idx = 0
             combo.setCurrentIndex(idx)
-    combo.blockSignals(False)
+        else:
+            idx = combo.findText(raw)
+            if idx >= 0:
+                combo.setCurrentIndex(idx)
 
     def _on_index_changed(index: int) -> None:
         if values:
@@ -130,14 +228,22 @@ def bind_combo_index(
     combo.currentIndexChanged.connect(_on_index_changed)
 
 
+# Change signal each bound widget type connects to. Panels build these
+# widgets from the concrete classes, so an exact type() lookup suffices.
+_SIGNAL_ATTR: dict[type, str] = {
+    QSpinBox: "valueChanged",
+    QCheckBox: "toggled",
+    QComboBox: "currentIndexChanged",
+    QLineEdit: "textChanged",
+}
+
+
 def disconnect_all(widget) -> None:
     """Disconnect all signals from a widget, ignoring errors."""
+    name = _SIGNAL_ATTR.get(type(widget))
+    if name is None:
+        return
     try:
-        if isinstance(widget, QSpinBox):
-            widget.valueChanged.disconnect()
-        elif isinstance(widget, QCheckBox):
-            widget.toggled.disconnect()
-        elif isinstance(widget, QComboBox):
-            widget.currentIndexChanged.disconnect()
+        getattr(widget, name).disconnect()
     except RuntimeError:
         pass  # No connections
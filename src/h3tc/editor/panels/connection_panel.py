@@ -30,7 +30,9 @@ class ConnectionPanel(QWidget):
     def __init__(self, parent=None) -> None:
         super().__init__(parent)
         self._connection: Connection | None = None
-        self._widgets: list = []
+        # One bound method shared by every binding's change callback
+        self._change_cb = self._on_change
+        self._bound = False  # Whether the widgets' change signals are connected
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
@@ -84,6 +86,13 @@ class ConnectionPanel(QWidget):
         layout.addWidget(rg)
         layout.addStretch()
 
+        # Every bound widget, disconnected before rebinding
+        self._widgets = (
+            self._zone1, self._zone2, self._value, self._wide,
+            self._border_guard, self._pos_min_human, self._pos_max_human,
+            self._pos_min_total, self._pos_max_total,
+        )
+
     def set_connection(self, connection: Connection) -> None:
         """Populate the panel from a connection model."""
         self._disconnect_all()
@@ -99,23 +108,25 @@ class ConnectionPanel(QWidget):
         self._bind_check(self._wide, connection, "wide")
         self._bind_check(self._border_guard, connection, "border_guard")
 
-        self._bind_spin(self._pos_min_human, connection, "min_human", sub_obj="positions")
-        self._bind_spin(self._pos_max_human, connection, "max_human", sub_obj="positions")
-        self._bind_spin(self._pos_min_total, connection, "min_total", sub_obj="positions")
-        self._bind_spin(self._pos_max_total, connection, "max_total", sub_obj="positions")
+        positions = connection.positions
+        self._bind_spin(self._pos_min_human, positions, "min_human")
+        self._bind_spin(self._pos_max_human, positions, "max_human")
+        self._bind_spin(self._pos_min_total, positions, "min_total")
+        self._bind_spin(self._pos_max_total, positions, "max_total")
+        self._bound = True
 
     def _on_change(self) -> None:
         self.connection_changed.emit()
 
     def _disconnect_all(self) -> None:
+        if not self._bound:
+            return  # Disconnecting unconnected signals only logs warnings
         for w in self._widgets:
             disconnect_all(w)
-        self._widgets.clear()
+        self._bound = False
 
     def _bind_spin(self, spin, obj, field, **kwargs) -> None:
-        bind_spinbox(spin, obj, field, on_change=self._on_change, **kwargs)
-        self._widgets.append(spin)
+        bind_spinbox(spin, obj, field, on_change=self._change_cb, **kwargs)
 
     def _bind_check(self, cb, obj, field, **kwargs) -> None:
-        bind_checkbox(cb, obj, field, on_change=self._on_change, **kwargs)
-        self._widgets.append(cb)
+        bind_checkbox(cb, obj, field, on_change=self._change_cb, **kwargs)
@@ -1,6 +1,6 @@
 """Map settings panel for name and size."""
 
-from PySide6.QtCore import Signal
+from PySide6.QtCore import QSignalBlocker, Signal
 from PySide6.QtWidgets import (
     QComboBox,
     QGridLayout,
@@ -33,13 +33,15 @@ MAP_SIZES: list[tuple[str, str]] = [
     ("99", "252x252 (G) with underground"),
 ]
 
-_SIZE_IDS = [s[0] for s in MAP_SIZES]
+_SIZE_INDEX = {sid: i for i, (sid, _) in enumerate(MAP_SIZES)}
+_SIZE_DISPLAY = [f"{sid} — {label}" for sid, label in MAP_SIZES]
 
 
 def _make_size_combo() -> QComboBox:
     combo = QComboBox()
-    for id_str, label in MAP_SIZES:
-        combo.addItem(f"{id_str} — {label}", userData=id_str)
+    combo.addItems(_SIZE_DISPLAY)
+    for i, (id_str, _) in enumerate(MAP_SIZES):
+        combo.setItemData(i, id_str)
     combo.setMinimumWidth(240)
     return combo
 
@@ -52,7 +54,7 @@ class MapPanel(QWidget):
     def __init__(self, parent=None) -> None:
         super().__init__(parent)
         self._template_map: TemplateMap | None = None
-        self._widgets: list = []
+        self._bound = False  # Whether the widgets' change signals are connected
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
@@ -89,43 +91,47 @@ class MapPanel(QWidget):
 
         layout.addStretch()
 
+        # Every bound widget, disconnected before rebinding
+        self._widgets = (self._name, self._min_size, self._max_size)
+
     def set_map(self, template_map: TemplateMap) -> None:
         """Populate the panel from a template map."""
         self._disconnect_all()
         self._template_map = template_map
 
-        self._name.blockSignals(True)
-        self._name.setText(template_map.name)
-        self._name.blockSignals(False)
+        with QSignalBlocker(self._name):
+            self._name.setText(template_map.name)
         self._name.textChanged.connect(self._on_name_changed)
-        self._widgets.append(self._name)
 
         # Set min size combo
-        self._min_size.blockSignals(True)
-        min_idx = self._index_for_size(template_map.min_size)
-        self._min_size.setCurrentIndex(min_idx)
-        self._min_size.blockSignals(False)
+        with QSignalBlocker(self._min_size):
+            min_idx = self._index_for_size(template_map.min_size)
+            self._min_size.setCurrentIndex(min_idx)
         self._min_size.currentIndexChanged.connect(self._on_min_size_changed)
-        self._widgets.append(self._min_size)
 
         # Set max size combo
-        self._max_size.blockSignals(True)
-        max_idx = self._index_for_size(template_map.max_size)
-        self._max_size.setCurrentIndex(max_idx)
-        self._max_size.blockSignals(False)
+        with QSignalBlocker(self._max_size):
+            max_idx = self._index_for_size(template_map.max_size)
+            self._max_size.setCurrentIndex(max_idx)
         self._max_size.currentIndexChanged.connect(self._on_max_size_changed)
-        self._widgets.append(self._max_size)
+        self._bound = True
+
+        self.refresh_counts()
 
-        self._zone_count.setText(f"Zones: {len(template_map.zones)}")
-        self._conn_count.setText(f"Connections: {len(template_map.connections)}")
+    def refresh_counts(self) -> None:
+        """Update the zone/connection counts after zones or connections change.
+
+        Cheaper than set_map(), which also rebinds every field widget.
+        """
+        tm = self._template_map
+        if tm is None:
+            return
+        self._zone_count.setText(f"Zones: {len(tm.zones)}")
+        self._conn_count.setText(f"Connections: {len(tm.connections)}")
 
     def _index_for_size(self, size_str: str) -> int:
         """Find combo index for a size ID string."""
-        val = size_str.strip()
-        try:
-            return _SIZE_IDS.index(val)
-        except ValueError:
-            return 0
+        return _SIZE_INDEX.get(size_str.strip(), 0)
 
     def _on_min_size_changed(self, index: int) -> None:
         if not self._template_map:
@@ -136,9 +142,8 @@ class MapPanel(QWidget):
         # Enforce min <= max
         max_idx = self._max_size.currentIndex()
         if max_idx < index:
-            self._max_size.blockSignals(True)
-            self._max_size.setCurrentIndex(index)
-            self._max_size.blockSignals(False)
+            with QSignalBlocker(self._max_size):
+                self._max_size.setCurrentIndex(index)
             self._template_map.max_size = min_id
 
         self._on_change()
@@ -152,9 +157,8 @@ class MapPanel(QWidget):
         # Enforce min <= max
         min_idx = self._min_size.currentIndex()
         if min_idx > index:
-            self._min_size.blockSignals(True)
-            self._min_size.setCurrentIndex(index)
-            self._min_size.blockSignals(False)
+            with QSignalBlocker(self._min_size):
+                self._min_size.setCurrentIndex(index)
             self._template_map.min_size = max_id
 
         self._on_change()
@@ -168,11 +172,8 @@ class MapPanel(QWidget):
         self.map_changed.emit()
 
     def _disconnect_all(self) -> None:
+        if not self._bound:
+            return  # Disconnecting unconnected signals only logs warnings
         for w in self._widgets:
             disconnect_all(w)
-            if isinstance(w, QLineEdit):
-                try:
-                    w.textChanged.disconnect()
-                except RuntimeError:
-                    pass
-        self._widgets.clear()
+        self._bound = False
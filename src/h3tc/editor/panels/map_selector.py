@@ -1,6 +1,6 @@
 """Dropdown to select the active map in a multi-map template pack."""
 
-from PySide6.QtCore import Signal
+from PySide6.QtCore import QSignalBlocker, Signal
 from PySide6.QtWidgets import QComboBox, QHBoxLayout, QLabel, QWidget
 
 from h3tc.models import TemplatePack
@@ -22,18 +22,19 @@ class MapSelector(QWidget):
         layout.addWidget(self._combo, 1)
 
         self._combo.currentIndexChanged.connect(self.map_selected.emit)
+        self._labels: list[str] = []  # Entries currently in the combo
 
     def set_pack(self, pack: TemplatePack) -> None:
         """Populate from a template pack."""
-        self._combo.blockSignals(True)
-        self._combo.clear()
-        for i, m in enumerate(pack.maps):
-            label = m.name if m.name else f"Map {i + 1}"
-            self._combo.addItem(label)
-        self._combo.blockSignals(False)
-
-        if pack.maps:
-            self._combo.setCurrentIndex(0)
+        labels = [m.name or f"Map {i + 1}" for i, m in enumerate(pack.maps)]
+        with QSignalBlocker(self._combo):
+            # Reopening a pack with the same maps keeps the existing entries
+            if labels != self._labels:
+                self._combo.clear()
+                self._combo.addItems(labels)
+                self._labels = labels
+            if labels:
+                self._combo.setCurrentIndex(0)
 
     @property
     def current_index(self) -> int:
@@ -1,6 +1,8 @@
 """Zone property panel with 5 tabs matching the HOTA template editor layout (SOD only)."""
 
-from PySide6.QtCore import Signal
+from operator import attrgetter
+
+from PySide6.QtCore import QSignalBlocker, Signal
 from PySide6.QtWidgets import (
     QCheckBox,
     QComboBox,
@@ -16,10 +18,11 @@ from PySide6.QtWidgets import (
 )
 
 from h3tc.editor.panels.binding import (
-    bind_checkbox,
-    bind_combo_index,
-    bind_spinbox,
-    disconnect_all,
+    connect_checkbox,
+    connect_spinbox,
+    is_flag_set,
+    sync_checkbox,
+    sync_spinbox,
 )
 from h3tc.enums import (
     MONSTER_FACTIONS_SOD,
@@ -33,10 +36,17 @@ from h3tc.models import Zone
 _SOD_TOWN_CANONICAL = [
     f if f != "Elemental" else "Conflux" for f in TOWN_FACTIONS_SOD
 ]
+# (label, canonical key) per town checkbox
+_SOD_TOWN_PAIRS = tuple(zip(TOWN_FACTIONS_SOD, _SOD_TOWN_CANONICAL))
 
 # Zone type options
 _ZONE_TYPES = ["Human Start", "Computer Start", "Treasure", "Junction"]
 _ZONE_TYPE_FIELDS = ["human_start", "computer_start", "treasure", "junction"]
+# Flag cells for each type index, in _ZONE_TYPE_FIELDS order
+_ZONE_TYPE_FLAGS = [
+    tuple("x" if i == j else "" for j in range(len(_ZONE_TYPE_FIELDS)))
+    for i in range(len(_ZONE_TYPE_FIELDS))
+]
 
 # Monster strength options (internal values match SOD format)
 _MONSTER_STRENGTHS = [
@@ -47,6 +57,12 @@ _MONSTER_STRENGTHS = [
 ]
 # HOTA uses different labels; map them to internal values for lookup
 _MONSTER_STRENGTH_ALIASES = {"avg": "normal", "none": ""}
+# Combo index for each internal value or alias
+_MONSTER_STRENGTH_INDEX = {val: i for i, (_, val) in enumerate(_MONSTER_STRENGTHS)}
+_MONSTER_STRENGTH_INDEX.update(
+    (alias, _MONSTER_STRENGTH_INDEX[val])
+    for alias, val in _MONSTER_STRENGTH_ALIASES.items()
+)
 
 
 def _make_spinbox(minimum: int = 0, maximum: int = 99999) -> QSpinBox:
@@ -60,6 +76,18 @@ def _make_checkbox(label: str) -> QCheckBox:
     return QCheckBox(label)
 
 
+def _set_tab_layout(tab: QWidget, layout: QVBoxLayout) -> None:
+    """Attach a fully built layout tree to *tab* in one relayout pass."""
+    tab.setUpdatesEnabled(False)
+    tab.setLayout(layout)
+    tab.setUpdatesEnabled(True)
+
+
+def _tier_getter(idx: int):
+    """Zone -> its idx-th treasure tier, or None if the zone has fewer."""
+    return lambda z: z.treasure_tiers[idx] if idx < len(z.treasure_tiers) else None
+
+
 class ZonePanel(QWidget):
     """Zone settings panel with 5 tabs: General, Towns, Content, Terrain, Monsters."""
 
@@ -68,7 +96,15 @@ class ZonePanel(QWidget):
     def __init__(self, parent=None) -> None:
         super().__init__(parent)
         self._zone: Zone | None = None
-        self._widgets: list = []  # Track all bound widgets for cleanup
+        # One bound method shared by every binding's change callback
+        self._change_cb = self._on_change
+        # Set while a Select All/None batch runs so it emits one change
+        self._bulk_update = False
+        self._bulk_changed = False
+        # (sync, widget, sub, field, dict_key) for every field widget. They
+        # are connected once at build time and write to whichever zone is
+        # shown, so switching zones only re-syncs values.
+        self._links: list[tuple] = []
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
@@ -80,52 +116,100 @@ class ZonePanel(QWidget):
         self._tabs = QTabWidget()
         layout.addWidget(self._tabs)
 
-        self._build_general_tab()
-        self._build_towns_tab()
-        self._build_content_tab()
-        self._build_terrain_tab()
-        self._build_monsters_tab()
+        # (title, build, populate) per tab; only General is built up front,
+        # the rest are filled into their placeholder page on first view.
+        # populate covers what the linked widgets don't (combos, enabling).
+        self._tab_specs = (
+            ("General", self._build_general_tab, self._populate_general),
+            ("Towns and Castles", self._build_towns_tab, self._populate_towns),
+            ("Content", self._build_content_tab, None),
+            ("Terrain", self._build_terrain_tab, None),
+            ("Monsters", self._build_monsters_tab, self._populate_monsters),
+        )
+        for title, _, _ in self._tab_specs:
+            self._tabs.addTab(QWidget(), title)
+        self._build_general_tab(self._tabs.widget(0))
+        self._built: set[int] = {0}
+        self._tabs.currentChanged.connect(self._ensure_tab_built)
 
     def set_zone(self, zone: Zone) -> None:
         """Populate the panel from a zone model."""
-        self._disconnect_all()
         self._zone = zone
         self._title.setText(f"Zone Settings - #{zone.id.strip()}")
-        self._populate_general()
-        self._populate_towns()
-        self._populate_content()
-        self._populate_terrain()
-        self._populate_monsters()
+        # Unbuilt tabs pick up the zone when they are first shown
+        self._sync_links(self._links)
+        for idx in sorted(self._built):
+            populate = self._tab_specs[idx][2]
+            if populate:
+                populate()
+
+    def _ensure_tab_built(self, idx: int) -> None:
+        if idx < 0 or idx in self._built:
+            return
+        self._built.add(idx)
+        _, build, populate = self._tab_specs[idx]
+        first_link = len(self._links)
+        build(self._tabs.widget(idx))
+        if self._zone is not None:
+            self._sync_links(self._links[first_link:])
+            if populate:
+                populate()
 
     def _on_change(self) -> None:
+        if self._bulk_update:
+            self._bulk_changed = True
+            return
         self.zone_changed.emit()
 
-    def _disconnect_all(self) -> None:
-        for w in self._widgets:
-            disconnect_all(w)
-        self._widgets.clear()
-
-    def _bind_spin(self, spin, obj, field, **kwargs) -> None:
-        bind_spinbox(spin, obj, field, on_change=self._on_change, **kwargs)
-        self._widgets.append(spin)
-
-    def _bind_check(self, cb, obj, field, **kwargs) -> None:
-        bind_checkbox(cb, obj, field, on_change=self._on_change, **kwargs)
-        self._widgets.append(cb)
+    def _set_all_checks(self, checks: dict[str, QCheckBox], checked: bool) -> None:
+        """Set every checkbox in *checks*, emitting zone_changed at most once."""
+        self._bulk_update = True
+        self._bulk_changed = False
+        try:
+            for cb in checks.values():
+                cb.setChecked(checked)
+        finally:
+            self._bulk_update = False
+        if self._bulk_changed:
+            self.zone_changed.emit()
+
+    def _sync_links(self, links) -> None:
+        z = self._zone
+        for sync, widget, sub, field, dict_key in links:
+            target = sub(z) if sub else z
+            if target is not None:
+                sync(widget, target, field, dict_key=dict_key)
+
+    def _resolver(self, sub):
+        """Callable giving the current zone, or sub(zone), or None."""
+        if sub is None:
+            return lambda: self._zone
+        return lambda: None if self._zone is None else sub(self._zone)
+
+    def _link_spin(self, spin, sub, field, dict_key=None) -> None:
+        """Connect *spin* to field on the current zone (or sub(zone))."""
+        connect_spinbox(
+            spin, self._resolver(sub), field,
+            dict_key=dict_key, on_change=self._change_cb,
+        )
+        self._links.append((sync_spinbox, spin, sub, field, dict_key))
 
-    def _bind_combo(self, combo, obj, field, **kwargs) -> None:
-        bind_combo_index(combo, obj, field, on_change=self._on_change, **kwargs)
-        self._widgets.append(combo)
+    def _link_check(self, cb, sub, field, dict_key=None) -> None:
+        """Connect *cb* to an 'x' flag field on the current zone (or sub(zone))."""
+        connect_checkbox(
+            cb, self._resolver(sub), field,
+            dict_key=dict_key, on_change=self._change_cb,
+        )
+        self._links.append((sync_checkbox, cb, sub, field, dict_key))
 
     # ── Tab 1: General ──────────────────────────────────────────────────
 
-    def _build_general_tab(self) -> None:
-        tab = QWidget()
-        main = QVBoxLayout(tab)
+    def _build_general_tab(self, tab: QWidget) -> None:
+        main = QVBoxLayout()
 
         # General group
         grp = QGroupBox("General")
-        g = QGridLayout(grp)
+        g = QGridLayout()
 
         g.addWidget(QLabel("Zone ID"), 0, 0)
         self._zone_id = _make_spinbox(1, 999)
@@ -139,6 +223,7 @@ class ZonePanel(QWidget):
         self._zone_type = QComboBox()
         self._zone_type.addItems(_ZONE_TYPES)
         self._zone_type.setFixedWidth(140)
+        self._zone_type.currentIndexChanged.connect(self._on_zone_type_changed)
         g.addWidget(self._zone_type, 2, 1)
 
         g.addWidget(QLabel("Owner"), 3, 0)
@@ -148,13 +233,15 @@ class ZonePanel(QWidget):
              "Player 5", "Player 6", "Player 7", "Player 8"]
         )
         self._owner.setFixedWidth(140)
+        self._owner.currentIndexChanged.connect(self._on_owner_changed)
         g.addWidget(self._owner, 3, 1)
 
+        grp.setLayout(g)
         main.addWidget(grp)
 
         # Requirements group
         req = QGroupBox("Requirements")
-        rg = QGridLayout(req)
+        rg = QGridLayout()
         rg.addWidget(QLabel("Human Positions"), 0, 0)
         self._pos_min_human = _make_spinbox()
         self._pos_max_human = _make_spinbox()
@@ -169,63 +256,54 @@ class ZonePanel(QWidget):
         rg.addWidget(QLabel("to"), 1, 2)
         rg.addWidget(self._pos_max_total, 1, 3)
 
+        req.setLayout(rg)
         main.addWidget(req)
         main.addStretch()
+        _set_tab_layout(tab, main)
 
-        self._tabs.addTab(tab, "General")
+        self._link_spin(self._zone_id, None, "id")
+        self._link_spin(self._base_size, None, "base_size")
+        positions = attrgetter("positions")
+        self._link_spin(self._pos_min_human, positions, "min_human")
+        self._link_spin(self._pos_max_human, positions, "max_human")
+        self._link_spin(self._pos_min_total, positions, "min_total")
+        self._link_spin(self._pos_max_total, positions, "max_total")
 
     def _populate_general(self) -> None:
         z = self._zone
 
-        self._bind_spin(self._zone_id, z, "id")
-        self._bind_spin(self._base_size, z, "base_size")
-
         # Zone type: find which type flag is set
-        self._zone_type.blockSignals(True)
-        type_idx = 0
-        for i, field in enumerate(_ZONE_TYPE_FIELDS):
-            if getattr(z, field).strip().lower() == "x":
-                type_idx = i
-                break
-        self._zone_type.setCurrentIndex(type_idx)
-        self._zone_type.blockSignals(False)
-        self._zone_type.currentIndexChanged.connect(self._on_zone_type_changed)
-        self._widgets.append(self._zone_type)
+        with QSignalBlocker(self._zone_type):
+            type_idx = next(
+                (i for i, field in enumerate(_ZONE_TYPE_FIELDS)
+                 if is_flag_set(getattr(z, field))),
+                0,
+            )
+            self._zone_type.setCurrentIndex(type_idx)
 
         # Owner
-        self._owner.blockSignals(True)
-        try:
-            owner_val = int(z.ownership) if z.ownership.strip() else 0
-        except ValueError:
-            owner_val = 0
-        self._owner.setCurrentIndex(owner_val)
-        self._owner.blockSignals(False)
-        self._owner.currentIndexChanged.connect(self._on_owner_changed)
-        self._widgets.append(self._owner)
+        with QSignalBlocker(self._owner):
+            owner = z.ownership.strip()
+            self._owner.setCurrentIndex(int(owner) if owner.isdecimal() else 0)
 
         # Enable owner for Human Start and Computer Start
         self._owner.setEnabled(type_idx in (0, 1))
 
-        # Position constraints
-        self._bind_spin(self._pos_min_human, z, "min_human", sub_obj="positions")
-        self._bind_spin(self._pos_max_human, z, "max_human", sub_obj="positions")
-        self._bind_spin(self._pos_min_total, z, "min_total", sub_obj="positions")
-        self._bind_spin(self._pos_max_total, z, "max_total", sub_obj="positions")
-
     def _on_zone_type_changed(self, index: int) -> None:
         if not self._zone:
             return
-        for i, field in enumerate(_ZONE_TYPE_FIELDS):
-            setattr(self._zone, field, "x" if i == index else "")
+        z = self._zone
+        z.human_start, z.computer_start, z.treasure, z.junction = (
+            _ZONE_TYPE_FLAGS[index]
+        )
         self._owner.setEnabled(index in (0, 1))
         if index not in (0, 1):
             self._zone.ownership = ""
-            self._owner.blockSignals(True)
-            self._owner.setCurrentIndex(0)
-            self._owner.blockSignals(False)
+            with QSignalBlocker(self._owner):
+                self._owner.setCurrentIndex(0)
         # Enable player towns only for Human Start / Computer Start
-        is_player_zone = index in (0, 1)
-        self._player_towns_group.setEnabled(is_player_zone)
+        if 1 in self._built:
+            self._player_towns_group.setEnabled(index in (0, 1))
         self._on_change()
 
     def _on_owner_changed(self, index: int) -> None:
@@ -236,16 +314,15 @@ class ZonePanel(QWidget):
 
     # ── Tab 2: Towns and Castles ─────────────────────────────────────────
 
-    def _build_towns_tab(self) -> None:
-        tab = QWidget()
-        main = QVBoxLayout(tab)
+    def _build_towns_tab(self, tab: QWidget) -> None:
+        main = QVBoxLayout()
 
         # Player Towns & Castles
         h = QHBoxLayout()
 
         self._player_towns_group = QGroupBox("Player Towns && Castles")
         pg = self._player_towns_group
-        pl = QGridLayout(pg)
+        pl = QGridLayout()
         pl.addWidget(QLabel("Minimum Towns"), 0, 0)
         self._pt_min_towns = _make_spinbox()
         pl.addWidget(self._pt_min_towns, 0, 1)
@@ -258,10 +335,11 @@ class ZonePanel(QWidget):
         pl.addWidget(QLabel("Castles density"), 3, 0)
         self._pt_castle_density = _make_spinbox()
         pl.addWidget(self._pt_castle_density, 3, 1)
+        pg.setLayout(pl)
         h.addWidget(pg)
 
         ng = QGroupBox("Neutral Towns && Castles")
-        nl = QGridLayout(ng)
+        nl = QGridLayout()
         nl.addWidget(QLabel("Minimum Towns"), 0, 0)
         self._nt_min_towns = _make_spinbox()
         nl.addWidget(self._nt_min_towns, 0, 1)
@@ -274,18 +352,17 @@ class ZonePanel(QWidget):
         nl.addWidget(QLabel("Castles density"), 3, 0)
         self._nt_castle_density = _make_spinbox()
         nl.addWidget(self._nt_castle_density, 3, 1)
+        ng.setLayout(nl)
         h.addWidget(ng)
 
         main.addLayout(h)
 
         # Allowed Towns
         ag = QGroupBox("Allowed Towns")
-        al_layout = QVBoxLayout(ag)
+        al_layout = QVBoxLayout()
         grid = QGridLayout()
         self._town_checks: dict[str, QCheckBox] = {}
-        for i, (sod_name, canonical) in enumerate(
-            zip(TOWN_FACTIONS_SOD, _SOD_TOWN_CANONICAL)
-        ):
+        for i, (sod_name, canonical) in enumerate(_SOD_TOWN_PAIRS):
             cb = QCheckBox(sod_name)
             self._town_checks[canonical] = cb
             grid.addWidget(cb, i // 3, i % 3)
@@ -294,61 +371,62 @@ class ZonePanel(QWidget):
         btn_row = QHBoxLayout()
         btn_all = QPushButton("Select All")
         btn_none = QPushButton("Select None")
-        btn_all.clicked.connect(lambda: self._set_all_town_checks(True))
-        btn_none.clicked.connect(lambda: self._set_all_town_checks(False))
+        btn_all.clicked.connect(
+            lambda: self._set_all_checks(self._town_checks, True)
+        )
+        btn_none.clicked.connect(
+            lambda: self._set_all_checks(self._town_checks, False)
+        )
         btn_row.addWidget(btn_all)
         btn_row.addWidget(btn_none)
         btn_row.addStretch()
         al_layout.addLayout(btn_row)
+        ag.setLayout(al_layout)
         main.addWidget(ag)
 
         # Town Type Rules
         rules = QGroupBox("Town Type Rules")
-        rl = QVBoxLayout(rules)
+        rl = QVBoxLayout()
         self._towns_same_type = QCheckBox("All towns/castles have same type")
         rl.addWidget(self._towns_same_type)
+        rules.setLayout(rl)
         main.addWidget(rules)
 
         main.addStretch()
-        self._tabs.addTab(tab, "Towns and Castles")
+        _set_tab_layout(tab, main)
 
-    def _set_all_town_checks(self, checked: bool) -> None:
-        for cb in self._town_checks.values():
-            cb.setChecked(checked)
+        pt = attrgetter("player_towns")
+        self._link_spin(self._pt_min_towns, pt, "min_towns")
+        self._link_spin(self._pt_town_density, pt, "town_density")
+        self._link_spin(self._pt_min_castles, pt, "min_castles")
+        self._link_spin(self._pt_castle_density, pt, "castle_density")
 
-    def _populate_towns(self) -> None:
-        z = self._zone
-        self._bind_spin(self._pt_min_towns, z, "min_towns", sub_obj="player_towns")
-        self._bind_spin(self._pt_town_density, z, "town_density", sub_obj="player_towns")
-        self._bind_spin(self._pt_min_castles, z, "min_castles", sub_obj="player_towns")
-        self._bind_spin(self._pt_castle_density, z, "castle_density", sub_obj="player_towns")
-
-        self._bind_spin(self._nt_min_towns, z, "min_towns", sub_obj="neutral_towns")
-        self._bind_spin(self._nt_town_density, z, "town_density", sub_obj="neutral_towns")
-        self._bind_spin(self._nt_min_castles, z, "min_castles", sub_obj="neutral_towns")
-        self._bind_spin(self._nt_castle_density, z, "castle_density", sub_obj="neutral_towns")
+        nt = attrgetter("neutral_towns")
+        self._link_spin(self._nt_min_towns, nt, "min_towns")
+        self._link_spin(self._nt_town_density, nt, "town_density")
+        self._link_spin(self._nt_min_castles, nt, "min_castles")
+        self._link_spin(self._nt_castle_density, nt, "castle_density")
 
         for canonical, cb in self._town_checks.items():
-            self._bind_check(cb, z, "town_types", dict_key=canonical)
-
-        self._bind_check(self._towns_same_type, z, "towns_same_type")
+            self._link_check(cb, None, "town_types", dict_key=canonical)
+        self._link_check(self._towns_same_type, None, "towns_same_type")
 
+    def _populate_towns(self) -> None:
+        z = self._zone
         # Disable player towns for non-player zones (treasure, junction)
         is_player_zone = (
-            z.human_start.strip().lower() == "x"
-            or z.computer_start.strip().lower() == "x"
+            is_flag_set(z.human_start) or is_flag_set(z.computer_start)
         )
         self._player_towns_group.setEnabled(is_player_zone)
 
     # ── Tab 3: Content ───────────────────────────────────────────────────
 
-    def _build_content_tab(self) -> None:
-        tab = QWidget()
-        main = QVBoxLayout(tab)
+    def _build_content_tab(self, tab: QWidget) -> None:
+        main = QVBoxLayout()
 
         # Treasure
         tg = QGroupBox("Treasure")
-        tl = QGridLayout(tg)
+        tl = QGridLayout()
         tl.addWidget(QLabel("low"), 0, 1)
         tl.addWidget(QLabel("high"), 0, 2)
         tl.addWidget(QLabel("density"), 0, 3)
@@ -364,11 +442,12 @@ class ZonePanel(QWidget):
             tl.addWidget(high, row, 2)
             tl.addWidget(density, row, 3)
             self._treasure_spins.append((low, high, density))
+        tg.setLayout(tl)
         main.addWidget(tg)
 
         # Mines & special objects
         mg = QGroupBox("Mines && special objects")
-        ml = QGridLayout(mg)
+        ml = QGridLayout()
         ml.addWidget(QLabel("type"), 0, 0)
         ml.addWidget(QLabel("min count"), 0, 1)
         ml.addWidget(QLabel("density"), 0, 2)
@@ -381,34 +460,30 @@ class ZonePanel(QWidget):
             ml.addWidget(min_count, row, 1)
             ml.addWidget(density, row, 2)
             self._mine_spins[resource] = (min_count, density)
+        mg.setLayout(ml)
         main.addWidget(mg)
 
         main.addStretch()
-        self._tabs.addTab(tab, "Content")
-
-    def _populate_content(self) -> None:
-        z = self._zone
+        _set_tab_layout(tab, main)
 
         for tier_idx, (low, high, density) in enumerate(self._treasure_spins):
-            if tier_idx < len(z.treasure_tiers):
-                tier = z.treasure_tiers[tier_idx]
-                self._bind_spin(low, tier, "low")
-                self._bind_spin(high, tier, "high")
-                self._bind_spin(density, tier, "density")
+            tier = _tier_getter(tier_idx)
+            self._link_spin(low, tier, "low")
+            self._link_spin(high, tier, "high")
+            self._link_spin(density, tier, "density")
 
         for resource, (min_spin, dens_spin) in self._mine_spins.items():
-            self._bind_spin(min_spin, z, "min_mines", dict_key=resource)
-            self._bind_spin(dens_spin, z, "mine_density", dict_key=resource)
+            self._link_spin(min_spin, None, "min_mines", dict_key=resource)
+            self._link_spin(dens_spin, None, "mine_density", dict_key=resource)
 
     # ── Tab 4: Terrain ───────────────────────────────────────────────────
 
-    def _build_terrain_tab(self) -> None:
-        tab = QWidget()
-        main = QVBoxLayout(tab)
+    def _build_terrain_tab(self, tab: QWidget) -> None:
+        main = QVBoxLayout()
 
         # Allowed Terrains
         tg = QGroupBox("Allowed Terrains")
-        tl = QVBoxLayout(tg)
+        tl = QVBoxLayout()
         grid = QGridLayout()
         self._terrain_checks: dict[str, QCheckBox] = {}
         for i, terrain in enumerate(TERRAINS_SOD):
@@ -420,12 +495,17 @@ class ZonePanel(QWidget):
         btn_row = QHBoxLayout()
         btn_all = QPushButton("Select All")
         btn_none = QPushButton("Select None")
-        btn_all.clicked.connect(lambda: self._set_all_terrain_checks(True))
-        btn_none.clicked.connect(lambda: self._set_all_terrain_checks(False))
+        btn_all.clicked.connect(
+            lambda: self._set_all_checks(self._terrain_checks, True)
+        )
+        btn_none.clicked.connect(
+            lambda: self._set_all_checks(self._terrain_checks, False)
+        )
         btn_row.addWidget(btn_all)
         btn_row.addWidget(btn_none)
         btn_row.addStretch()
         tl.addLayout(btn_row)
+        tg.setLayout(tl)
         main.addWidget(tg)
 
         # Match to town
@@ -433,38 +513,34 @@ class ZonePanel(QWidget):
         main.addWidget(self._terrain_match)
 
         main.addStretch()
-        self._tabs.addTab(tab, "Terrain")
-
-    def _set_all_terrain_checks(self, checked: bool) -> None:
-        for cb in self._terrain_checks.values():
-            cb.setChecked(checked)
+        _set_tab_layout(tab, main)
 
-    def _populate_terrain(self) -> None:
-        z = self._zone
         for terrain, cb in self._terrain_checks.items():
-            self._bind_check(cb, z, "terrains", dict_key=terrain)
-        self._bind_check(self._terrain_match, z, "terrain_match")
+            self._link_check(cb, None, "terrains", dict_key=terrain)
+        self._link_check(self._terrain_match, None, "terrain_match")
 
     # ── Tab 5: Monsters ──────────────────────────────────────────────────
 
-    def _build_monsters_tab(self) -> None:
-        tab = QWidget()
-        main = QVBoxLayout(tab)
+    def _build_monsters_tab(self, tab: QWidget) -> None:
+        main = QVBoxLayout()
 
         # General
         gg = QGroupBox("General")
-        gl = QGridLayout(gg)
+        gl = QGridLayout()
         gl.addWidget(QLabel("Strength"), 0, 0)
         self._monster_strength = QComboBox()
-        for label, _ in _MONSTER_STRENGTHS:
-            self._monster_strength.addItem(label)
+        self._monster_strength.addItems([label for label, _ in _MONSTER_STRENGTHS])
         self._monster_strength.setFixedWidth(120)
+        self._monster_strength.currentIndexChanged.connect(
+            self._on_monster_strength_changed
+        )
         gl.addWidget(self._monster_strength, 0, 1)
+        gg.setLayout(gl)
         main.addWidget(gg)
 
         # Monster Type
         mg = QGroupBox("Monster Type")
-        ml = QVBoxLayout(mg)
+        ml = QVBoxLayout()
 
         self._monster_match = QCheckBox("Match to town")
         ml.addWidget(self._monster_match)
@@ -480,45 +556,35 @@ class ZonePanel(QWidget):
         btn_row = QHBoxLayout()
         btn_all = QPushButton("Select All")
         btn_none = QPushButton("Select None")
-        btn_all.clicked.connect(lambda: self._set_all_monster_checks(True))
-        btn_none.clicked.connect(lambda: self._set_all_monster_checks(False))
+        btn_all.clicked.connect(
+            lambda: self._set_all_checks(self._monster_checks, True)
+        )
+        btn_none.clicked.connect(
+            lambda: self._set_all_checks(self._monster_checks, False)
+        )
         btn_row.addWidget(btn_all)
         btn_row.addWidget(btn_none)
         btn_row.addStretch()
         ml.addLayout(btn_row)
+        mg.setLayout(ml)
         main.addWidget(mg)
 
         main.addStretch()
-        self._tabs.addTab(tab, "Monsters")
+        _set_tab_layout(tab, main)
 
-    def _set_all_monster_checks(self, checked: bool) -> None:
-        for cb in self._monster_checks.values():
-            cb.setChecked(checked)
+        self._link_check(self._monster_match, None, "monster_match")
+        for faction, cb in self._monster_checks.items():
+            self._link_check(cb, None, "monster_factions", dict_key=faction)
 
     def _populate_monsters(self) -> None:
         z = self._zone
 
         # Monster strength
-        self._monster_strength.blockSignals(True)
-        raw = z.monster_strength.strip().lower()
-        # Normalize HOTA aliases to internal values
-        raw = _MONSTER_STRENGTH_ALIASES.get(raw, raw)
-        idx = 0
-        for i, (_, val) in enumerate(_MONSTER_STRENGTHS):
-            if val == raw:
-                idx = i
-                break
-        self._monster_strength.setCurrentIndex(idx)
-        self._monster_strength.blockSignals(False)
-        self._monster_strength.currentIndexChanged.connect(
-            self._on_monster_strength_changed
-        )
-        self._widgets.append(self._monster_strength)
-
-        self._bind_check(self._monster_match, z, "monster_match")
-
-        for faction, cb in self._monster_checks.items():
-            self._bind_check(cb, z, "monster_factions", dict_key=faction)
+        with QSignalBlocker(self._monster_strength):
+            raw = z.monster_strength.strip().lower()
+            # HOTA aliases resolve to the same index as their internal value
+            idx = _MONSTER_STRENGTH_INDEX.get(raw, 0)
+            self._monster_strength.setCurrentIndex(idx)
 
     def _on_monster_strength_changed(self, index: int) -> None:
         if not self._zone:
@@ -13,6 +13,7 @@ Instead, detection inspects the file structure:
     the sub-version ("11" = 1.7.x, "12" = 1.8.x)
 """
 
+from itertools import islice
 from pathlib import Path
 
 from h3tc.parsers.base import BaseParser
@@ -22,6 +23,7 @@ from h3tc.parsers.sod import SodParser
 
 # All registered parsers
 PARSERS: list[BaseParser] = [SodParser(), HotaParser(), Hota18Parser()]
+_PARSERS_BY_ID: dict[str, BaseParser] = {p.format_id: p for p in PARSERS}
 
 # Town field-count values that identify HOTA sub-versions
 _HOTA_TOWN_COUNTS = {
@@ -35,42 +37,41 @@ def detect_format(filepath: Path) -> BaseParser:
 
     Only reads the first 4 lines of the file.
     """
-    rows = _read_first_rows(filepath, count=4)
+    cells = _read_first_cells(filepath, count=4)
 
-    if not rows:
+    if not cells:
         return _get("sod")
 
     # SOD files have "Map" as the very first cell (header row 1, column 0).
     # HOTA files never start with "Map" — they start with "Pack" or a
     # field-count label.
-    first_cell = rows[0][0].strip() if rows[0] else ""
-    if first_cell == "Map":
+    if cells[0].strip() == "Map":
         return _get("sod")
 
     # HOTA family: the first data row (row index 3) has the town field count
     # at column 0, which tells us the sub-version.
-    if len(rows) > 3 and rows[3]:
-        town_count = rows[3][0].strip()
+    if len(cells) > 3:
+        town_count = cells[3].strip()
         format_id = _HOTA_TOWN_COUNTS.get(town_count, "hota17")
         return _get(format_id)
 
     return _get("hota17")
 
 
-def _read_first_rows(filepath: Path, count: int) -> list[list[str]]:
-    """Read the first N tab-delimited rows from a file."""
-    raw = filepath.read_bytes()
-    try:
-        text = raw.decode("ascii")
-    except UnicodeDecodeError:
-        text = raw.decode("latin-1")
+def _read_first_cells(filepath: Path, count: int) -> list[str]:
+    """Read column 0 of the non-empty rows among the first N lines."""
+    # Only the leading lines are read, not the whole template
+    with filepath.open("rb") as f:
+        raw = b"".join(islice(f, count))
+    # ASCII is a subset of latin-1, which decodes any byte
+    text = raw.decode("latin-1")
 
-    rows = []
+    cells = []
     for line in text.split("\n")[:count]:
         line = line.rstrip("\r")
         if line:
-            rows.append(line.split("\t"))
-    return rows
+            cells.append(line.partition("\t")[0])
+    return cells
 
 
 def get_parser(format_id: str) -> BaseParser:
@@ -79,7 +80,7 @@ def get_parser(format_id: str) -> BaseParser:
 
 
 def _get(format_id: str) -> BaseParser:
-    for parser in PARSERS:
-        if parser.format_id == format_id:
-            return parser
-    raise ValueError(f"Unknown format: {format_id}")
+    parser = _PARSERS_BY_ID.get(format_id)
+    if parser is None:
+        raise ValueError(f"Unknown format: {format_id}")
+    return parser
@@ -45,10 +45,7 @@ class HotaParser(BaseParser):
     def parse(self, filepath: Path) -> TemplatePack:
         c = self._col
         raw = filepath.read_bytes()
-        try:
-            text = raw.decode("ascii")
-        except UnicodeDecodeError:
-            text = raw.decode("latin-1")
+        text = raw.decode("latin-1")
         text = text.replace("\r\n", "\n").replace("\r", "\n")
 
         reader = csv.reader(io.StringIO(text), delimiter="\t", quotechar='"')
@@ -0,0 +1,70 @@
+"""Tests for the zone layout sidecar file."""
+
+import json
+
+import pytest
+
+from h3tc.editor.models import layout_store
+from h3tc.editor.models.layout_store import load_layout, save_layout, sidecar_path
+
+
+def _write_sidecar(template, data) -> None:
+    sidecar_path(template).write_text(json.dumps(data), encoding="utf-8")
+
+
+class TestLayoutStore:
+    def test_round_trip(self, tmp_path):
+        template = tmp_path / "pack.txt"
+        layouts = {
+            "Map A": {"1": (10.0, -20.5), "2": (300.25, 0.0)},
+            "Map B": {},
+        }
+
+        save_layout(template, layouts)
+
+        data = json.loads(sidecar_path(template).read_text("utf-8"))
+        assert data["version"] == 2
+        assert data["maps"]["Map A"]["zones"]["1"] == [10.0, -20.5]
+        assert load_layout(template) == {
+            "Map A": {"1": (10.0, -20.5), "2": (300.2, 0.0)},
+            "Map B": {},
+        }
+
+    def test_loads_v1_dict_positions(self, tmp_path):
+        template = tmp_path / "pack.txt"
+        _write_sidecar(template, {
+            "version": 1,
+            "maps": {"Map A": {"zones": {"1": {"x": 5, "y": 6.5}}}},
+        })
+
+        assert load_layout(template) == {"Map A": {"1": (5.0, 6.5)}}
+
+    def test_unknown_version_is_ignored(self, tmp_path):
+        template = tmp_path / "pack.txt"
+        _write_sidecar(template, {
+            "version": 99,
+            "maps": {"Map A": {"zones": {"1": [1, 2]}}},
+        })
+
+        assert load_layout(template) == {}
+
+    def test_missing_or_corrupt_sidecar_is_empty(self, tmp_path):
+        template = tmp_path / "pack.txt"
+        assert load_layout(template) == {}
+
+        sidecar_path(template).write_bytes(b"{not json")
+        assert load_layout(template) == {}
+
+    def test_failed_write_keeps_old_sidecar_and_no_tmp(self, tmp_path, monkeypatch):
+        template = tmp_path / "pack.txt"
+        save_layout(template, {"Map A": {"1": (1.0, 2.0)}})
+
+        def fail(src, dst):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(layout_store.os, "replace", fail)
+        with pytest.raises(OSError):
+            save_layout(template, {"Map A": {"1": (9.0, 9.0)}})
+
+        assert [p.name for p in tmp_path.iterdir()] == ["pack.txt.h3tc-layout.json"]
+        assert load_layout(template) == {"Map A": {"1": (1.0, 2.0)}}
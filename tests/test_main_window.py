@@ -0,0 +1,103 @@
+"""Tests for MainWindow scene and layout lifecycle."""
+
+import os
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtCore import QThreadPool
+from PySide6.QtWidgets import QApplication
+
+from h3tc.editor.main_window import MainWindow, _default_header_rows
+from h3tc.editor.models.layout_store import sidecar_path
+from h3tc.models import Connection, TemplateMap, TemplatePack, Zone
+from h3tc.writers.sod import SodWriter
+
+_app = QApplication.instance() or QApplication([])
+
+
+def _write_ring_pack(path, n: int) -> None:
+    zones = [Zone(id=str(i)) for i in range(1, n + 1)]
+    conns = [
+        Connection(zone1=str(i), zone2=str(i % n + 1), value="1")
+        for i in range(1, n + 1)
+    ]
+    pack = TemplatePack(
+        header_rows=_default_header_rows(),
+        maps=[TemplateMap(name="ring", zones=zones, connections=conns)],
+    )
+    SodWriter().write(pack, path)
+
+
+def _settle() -> None:
+    QThreadPool.globalInstance().waitForDone()
+    _app.processEvents()
+
+
+class TestOpenFile:
+    def test_opening_another_pack_cancels_pending_layout(self, tmp_path):
+        first, second = tmp_path / "a.txt", tmp_path / "b.txt"
+        _write_ring_pack(first, 40)
+        _write_ring_pack(second, 40)
+        window = MainWindow()
+
+        window.open_file(first)
+        old = window._scene
+        assert old._pending_layout
+        applied = []
+        old.layout_applied.connect(lambda: applied.append(1))
+        before = old.get_zone_positions()
+
+        window.open_file(second)
+        _settle()
+
+        assert window._scene is not old
+        assert applied == []
+        assert old._pending_layout == {}
+        assert old.get_zone_positions() == before
+        assert window._scene._pending_layout == {}
+
+
+class TestSidecarLoading:
+    def _open(self, tmp_path, n: int = 4) -> MainWindow:
+        path = tmp_path / "pack.txt"
+        _write_ring_pack(path, n)
+        window = MainWindow()
+        window.open_file(path)
+        _settle()
+        return window
+
+    def test_late_sidecar_applies_to_unedited_scene(self, tmp_path):
+        window = self._open(tmp_path)
+
+        window._on_sidecar_loaded(
+            window._open_generation, {"ring": {"1": (-500.0, -500.0)}}
+        )
+
+        assert window._scene.get_zone_positions()["1"] == (-500.0, -500.0)
+
+    def test_late_sidecar_keeps_user_drag(self, tmp_path):
+        window = self._open(tmp_path)
+        window._scene.get_zone_item("1").setPos(300.0, 300.0)
+        _settle()
+
+        window._on_sidecar_loaded(
+            window._open_generation, {"ring": {"1": (-500.0, -500.0)}}
+        )
+
+        assert window._scene.get_zone_positions()["1"] == (300.0, 300.0)
+        assert window._layouts_cache[0] == {"1": (-500.0, -500.0)}
+
+    def test_malformed_sidecar_still_reports(self, tmp_path):
+        path = tmp_path / "pack.txt"
+        _write_ring_pack(path, 4)
+        sidecar_path(path).write_text('{"version": 2, "maps": {"ring": '
+                                      '{"zones": {"1": ["a", "b"]}}}}')
+        window = MainWindow()
+        results = []
+        window._sidecar_signals.finished.connect(
+            lambda gen, layouts: results.append(layouts)
+        )
+
+        window.open_file(path)
+        _settle()
+
+        assert results == [{}]
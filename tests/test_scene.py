@@ -0,0 +1,243 @@
+"""Tests for TemplateScene item bookkeeping."""
+
+import gc
+import os
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtCore import QThreadPool
+from PySide6.QtWidgets import QApplication
+
+from h3tc.editor.canvas.connection_item import ConnectionItem
+from h3tc.editor.canvas.layout import force_directed_layout
+from h3tc.editor.canvas.scene import TemplateScene
+from h3tc.models import Connection, TemplateMap, Zone, ZoneOptions
+
+# Ensure a QApplication exists for QGraphicsScene
+_app = QApplication.instance() or QApplication([])
+
+
+def _make_map(
+    zone_ids: list[str], connections: list[tuple[str, str]]
+) -> TemplateMap:
+    zones = [
+        Zone(id=zid, zone_options=ZoneOptions(image_settings=f"{i * 100} 0"))
+        for i, zid in enumerate(zone_ids)
+    ]
+    conns = [Connection(zone1=z1, zone2=z2, value="5000") for z1, z2 in connections]
+    return TemplateMap(name="test", zones=zones, connections=conns)
+
+
+def _load(zone_ids, connections) -> tuple[TemplateScene, TemplateMap]:
+    tmap = _make_map(zone_ids, connections)
+    scene = TemplateScene()
+    scene.load_map(tmap)
+    return scene, tmap
+
+
+def _connection_items(scene: TemplateScene) -> list[ConnectionItem]:
+    return [i for i in scene.items() if isinstance(i, ConnectionItem)]
+
+
+class TestConnectionIncidence:
+    def test_moving_zone_refreshes_only_incident_paths(self):
+        scene, _ = _load(["1", "2", "3"], [("1", "2"), ("2", "3")])
+        z1 = scene.get_zone_item("1")
+        by_pair = {
+            (ci.connection.zone1, ci.connection.zone2): ci
+            for ci in _connection_items(scene)
+        }
+        before_other = by_pair[("2", "3")].path().boundingRect()
+
+        z1.setPos(z1.pos().x(), z1.pos().y() + 500)
+        _app.processEvents()
+
+        moved = by_pair[("1", "2")].path().boundingRect()
+        assert moved.bottom() > 400
+        assert by_pair[("2", "3")].path().boundingRect() == before_other
+
+    def test_delete_zone_removes_incident_connections(self):
+        scene, tmap = _load(["1", "2", "3"], [("1", "2"), ("2", "3"), ("1", "3")])
+        scene.get_zone_item("2").setSelected(True)
+        scene.delete_selected()
+
+        assert [z.id for z in tmap.zones] == ["1", "3"]
+        assert [(c.zone1, c.zone2) for c in tmap.connections] == [("1", "3")]
+        assert len(_connection_items(scene)) == 1
+
+    def test_delete_zone_and_its_connection_together(self):
+        scene, tmap = _load(["1", "2"], [("1", "2")])
+        scene.get_zone_item("1").setSelected(True)
+        _connection_items(scene)[0].setSelected(True)
+        scene.delete_selected()
+
+        assert [z.id for z in tmap.zones] == ["2"]
+        assert tmap.connections == []
+        assert _connection_items(scene) == []
+
+    def test_added_connection_follows_zone(self):
+        scene, _ = _load(["1", "2"], [])
+        ci = scene.add_connection(Connection(zone1="1", zone2="2", value="1"))
+        z2 = scene.get_zone_item("2")
+        z2.setPos(z2.pos().x(), z2.pos().y() + 500)
+        _app.processEvents()
+        assert ci.path().boundingRect().bottom() > 400
+
+    def test_group_move_is_flushed_once(self):
+        scene, _ = _load(["1", "2", "3"], [("1", "2"), ("2", "3")])
+        emitted = []
+        scene.scene_modified.connect(lambda: emitted.append(1))
+
+        for zid in ("1", "2", "3"):
+            zi = scene.get_zone_item(zid)
+            zi.setPos(zi.pos().x(), zi.pos().y() + 500)
+        assert emitted == []
+        _app.processEvents()
+
+        assert len(emitted) == 1
+        for ci in _connection_items(scene):
+            assert ci.path().boundingRect().bottom() > 400
+
+
+class TestScaleZoneDistances:
+    def test_scales_about_centroid_and_emits_once(self):
+        scene, _ = _load(["1", "2"], [("1", "2")])
+        scene.get_zone_item("1").setPos(0, 0)
+        scene.get_zone_item("2").setPos(200, 100)
+        emitted = []
+        scene.scene_modified.connect(lambda: emitted.append(1))
+
+        scene.scale_zone_distances(2.0)
+
+        assert scene.get_zone_positions() == {
+            "1": (-100.0, -50.0),
+            "2": (300.0, 150.0),
+        }
+        assert len(emitted) == 1
+        path = _connection_items(scene)[0].path().boundingRect()
+        assert path.right() >= 300
+
+
+class TestConnectionPairs:
+    def test_pairs_follow_added_and_edited_connections(self):
+        scene, tmap = _load(["1", "2", "3"], [("1", "2")])
+        assert scene._connection_pairs() == [("1", "2")]
+
+        ci = scene.add_connection(Connection(zone1="2", zone2=" 3 ", value="1"))
+        assert scene._connection_pairs() == [("1", "2"), ("2", "3")]
+
+        ci.connection.zone2 = "1"
+        scene.refresh_connection(ci.connection)
+        assert scene._connection_pairs() == [("1", "2"), ("2", "1")]
+
+    def test_has_connection_is_order_independent_and_tracks_edits(self):
+        scene, _ = _load(["1", "2", "3"], [("1", "2")])
+        assert scene.has_connection("2", "1")
+        assert not scene.has_connection("2", "3")
+
+        ci = scene.add_connection(Connection(zone1="3", zone2="2", value="1"))
+        assert scene.has_connection("2", "3")
+
+        ci.setSelected(True)
+        scene.delete_selected()
+        assert not scene.has_connection("2", "3")
+
+
+class TestSelectionSignals:
+    def test_unchanged_primary_selection_is_not_re_emitted(self):
+        scene, _ = _load(["1", "2"], [("1", "2")])
+        emitted = []
+        scene.zone_selected.connect(lambda z: emitted.append(z.id))
+        scene.selection_cleared.connect(lambda: emitted.append(None))
+
+        scene.get_zone_item("1").setSelected(True)
+        # Rubber-band ticks re-fire the signal with the same selection
+        scene.selectionChanged.emit()
+        scene.selectionChanged.emit()
+        scene.clearSelection()
+        scene.selectionChanged.emit()
+
+        assert emitted == ["1", None]
+
+
+class TestBackgroundLayout:
+    def _ring_map(self, n: int) -> TemplateMap:
+        zones = [Zone(id=str(i)) for i in range(1, n + 1)]
+        conns = [
+            Connection(zone1=str(i), zone2=str(i % n + 1), value="1")
+            for i in range(1, n + 1)
+        ]
+        return TemplateMap(name="ring", zones=zones, connections=conns)
+
+    def _settle(self) -> None:
+        QThreadPool.globalInstance().waitForDone()
+        _app.processEvents()
+
+    def test_large_map_gets_force_directed_positions(self):
+        tmap = self._ring_map(40)
+        scene = TemplateScene()
+        applied = []
+        scene.layout_applied.connect(lambda: applied.append(1))
+        scene.load_map(tmap)
+        self._settle()
+
+        assert applied == [1]
+        assert scene.get_zone_positions() == force_directed_layout(tmap)
+
+    def test_saved_positions_are_kept(self):
+        tmap = self._ring_map(40)
+        scene = TemplateScene()
+        scene.load_map(tmap, {"1": (-1000.0, -1000.0)})
+        self._settle()
+
+        assert scene.get_zone_positions()["1"] == (-1000.0, -1000.0)
+
+    def test_late_positions_win_over_background_layout(self):
+        scene = TemplateScene()
+        scene.load_map(self._ring_map(40))
+        scene.apply_positions({"1": (-1000.0, -1000.0)})
+        self._settle()
+
+        assert scene.get_zone_positions()["1"] == (-1000.0, -1000.0)
+
+    def test_zone_dragged_before_layout_lands_is_kept(self):
+        scene = TemplateScene()
+        scene.load_map(self._ring_map(40))
+        scene.get_zone_item("1").setPos(-1000.0, -1000.0)
+        self._settle()
+
+        positions = scene.get_zone_positions()
+        assert positions["1"] == (-1000.0, -1000.0)
+        assert positions["2"] == force_directed_layout(scene.template_map)["2"]
+
+    def test_layout_finishing_after_scene_is_deleted(self):
+        scene = TemplateScene()
+        scene.load_map(self._ring_map(40))
+        signals = scene._layout_signals
+        results = []
+        signals.finished.connect(lambda gen, positions: results.append(gen))
+        del scene
+        gc.collect()
+        self._settle()
+
+        assert len(results) == 1
+
+    def test_stale_layout_is_ignored(self):
+        scene = TemplateScene()
+        scene.load_map(self._ring_map(40))
+        scene.load_map(_make_map(["1", "2"], [("1", "2")]))
+        before = scene.get_zone_positions()
+        self._settle()
+
+        assert scene.get_zone_positions() == before
+
+
+class TestRefreshZones:
+    def test_swapped_ids_keep_both_items(self):
+        scene, tmap = _load(["2", "1"], [("2", "1")])
+        items = {zid: scene.get_zone_item(zid) for zid in ("1", "2")}
+        tmap.zones[0].id, tmap.zones[1].id = "1", "2"
+
+        scene.refresh_zones(tmap.zones)
+
+        assert scene.get_zone_item("1") is items["2"]
+        assert scene.get_zone_item("2") is items["1"]